@@ -1,14 +1,23 @@
 """Authentication providers for DataAPI SDK."""
 
+import asyncio
+import importlib.util
 import time
 from abc import ABC, abstractmethod
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
 
 import httpx
-from pydantic import BaseModel, Field, SecretStr
+from pydantic import BaseModel, PrivateAttr, SecretStr
 
 from .exceptions import AuthenticationError
 
+# URL schemes accepted for OAuth2 token endpoints
+_TOKEN_URL_SCHEMES = frozenset({"http", "https"})
+
+# HTTP/2 support in httpx needs the optional h2 package
+_HAS_H2 = importlib.util.find_spec("h2") is not None
+
 
 class AuthProvider(ABC):
     """Abstract base class for authentication providers."""
@@ -33,6 +42,17 @@ class AuthProvider(ABC):
             AuthenticationError: If refresh fails
         """
         pass
+    
+    def get_cached_headers(self) -> Optional[Dict[str, str]]:
+        """Get authentication headers if they are available without I/O.
+        
+        Sync callers use this to skip the event loop; when it returns None
+        they fall back to awaiting ``get_headers``.
+        
+        Returns:
+            Dictionary of headers, or None if they must be fetched first
+        """
+        return None
 
 
 class APIKeyAuth(AuthProvider):
@@ -41,19 +61,36 @@ class APIKeyAuth(AuthProvider):
     Args:
         api_key: The API key for authentication
         header_name: Name of the header to use for the API key
+        
+    Raises:
+        ValueError: If the API key is empty
     """
     
     def __init__(self, api_key: str, header_name: str = "X-API-Key") -> None:
+        if not api_key:
+            raise ValueError("API key cannot be empty")
+        
         self.api_key = SecretStr(api_key)
         self.header_name = header_name
+        self._headers = {header_name: api_key}
     
     async def get_headers(self) -> Dict[str, str]:
         """Get API key headers.
         
+        The returned dictionary is shared and must not be mutated.
+        
         Returns:
             Dictionary containing the API key header
         """
-        return {self.header_name: self.api_key.get_secret_value()}
+        return self._headers
+    
+    def get_cached_headers(self) -> Dict[str, str]:
+        """Get API key headers without awaiting.
+        
+        Returns:
+            Dictionary containing the API key header
+        """
+        return self._headers
     
     async def refresh_if_needed(self) -> None:
         """API keys don't need refreshing."""
@@ -65,18 +102,35 @@ class BearerTokenAuth(AuthProvider):
     
     Args:
         token: The bearer token for authentication
+        
+    Raises:
+        ValueError: If the token is empty
     """
     
     def __init__(self, token: str) -> None:
+        if not token:
+            raise ValueError("Token cannot be empty")
+        
         self.token = SecretStr(token)
+        self._headers = {"Authorization": f"Bearer {token}"}
     
     async def get_headers(self) -> Dict[str, str]:
         """Get bearer token headers.
         
+        The returned dictionary is shared and must not be mutated.
+        
         Returns:
             Dictionary containing the authorization header
         """
-        return {"Authorization": f"Bearer {self.token.get_secret_value()}"}
+        return self._headers
+    
+    def get_cached_headers(self) -> Dict[str, str]:
+        """Get bearer token headers without awaiting.
+        
+        Returns:
+            Dictionary containing the authorization header
+        """
+        return self._headers
     
     async def refresh_if_needed(self) -> None:
         """Bearer tokens don't need refreshing."""
@@ -100,12 +154,14 @@ class OAuth2Token(BaseModel):
     refresh_token: Optional[SecretStr] = None
     scope: Optional[str] = None
     
-    # Internal fields
-    _issued_at: float = Field(default_factory=time.time, alias="issued_at")
+    # Monotonic clock deadline after which the token counts as expired
+    _expires_at: Optional[float] = PrivateAttr(default=None)
     
-    class Config:
-        """Pydantic configuration."""
-        allow_population_by_field_name = True
+    def model_post_init(self, __context: Any) -> None:
+        """Compute the expiry deadline once, when the token is issued."""
+        if self.expires_in is not None:
+            # Add 60 second buffer to avoid using tokens that expire very soon
+            self._expires_at = time.monotonic() + self.expires_in - 60
     
     @property
     def is_expired(self) -> bool:
@@ -114,12 +170,7 @@ class OAuth2Token(BaseModel):
         Returns:
             True if token is expired, False otherwise
         """
-        if self.expires_in is None:
-            return False
-        
-        # Add 60 second buffer to avoid using tokens that expire very soon
-        expiry_time = self._issued_at + self.expires_in - 60
-        return time.time() >= expiry_time
+        return self._expires_at is not None and time.monotonic() >= self._expires_at
 
 
 class OAuth2Auth(AuthProvider):
@@ -131,6 +182,10 @@ class OAuth2Auth(AuthProvider):
         token_url: URL to obtain tokens
         scope: Optional scope for the token
         token: Optional existing token
+        
+    Raises:
+        ValueError: If the client credentials are empty or the token URL
+            is not an absolute HTTP(S) URL
     """
     
     def __init__(
@@ -141,16 +196,34 @@ class OAuth2Auth(AuthProvider):
         scope: Optional[str] = None,
         token: Optional[OAuth2Token] = None,
     ) -> None:
+        if not client_id:
+            raise ValueError("Client ID cannot be empty")
+        if not client_secret:
+            raise ValueError("Client secret cannot be empty")
+        
+        parts = urlsplit(token_url)
+        if parts.scheme not in _TOKEN_URL_SCHEMES or not parts.netloc:
+            raise ValueError(f"Invalid token URL: {token_url}")
+        
         self.client_id = client_id
         self.client_secret = SecretStr(client_secret)
         self.token_url = token_url
         self.scope = scope
         self._token = token
-        self._http_client = httpx.AsyncClient()
+        self._headers: Optional[Dict[str, str]] = None
+        self._refresh_lock: Optional[asyncio.Lock] = None
+        # Token requests are rare, so keep a single reusable connection
+        self._http_client = httpx.AsyncClient(
+            http2=_HAS_H2,
+            limits=httpx.Limits(max_keepalive_connections=1),
+        )
     
     async def get_headers(self) -> Dict[str, str]:
         """Get OAuth2 headers.
         
+        The headers are built once per token and reused until it is
+        refreshed. The returned dictionary is shared and must not be mutated.
+        
         Returns:
             Dictionary containing the authorization header
             
@@ -162,18 +235,45 @@ class OAuth2Auth(AuthProvider):
         if self._token is None:
             raise AuthenticationError("No valid OAuth2 token available")
         
-        return {
-            "Authorization": f"{self._token.token_type} {self._token.access_token.get_secret_value()}"
-        }
+        return self._build_headers()
+    
+    def get_cached_headers(self) -> Optional[Dict[str, str]]:
+        """Get OAuth2 headers if the current token is still valid.
+        
+        Returns:
+            Dictionary containing the authorization header, or None if the
+            token is missing or expired and must be refreshed first
+        """
+        if self._token is None or self._token.is_expired:
+            return None
+        return self._build_headers()
+    
+    def _build_headers(self) -> Dict[str, str]:
+        """Build the headers for the current token once and reuse them."""
+        if self._headers is None:
+            self._headers = {
+                "Authorization": f"{self._token.token_type} {self._token.access_token.get_secret_value()}"
+            }
+        return self._headers
     
     async def refresh_if_needed(self) -> None:
         """Refresh token if needed.
         
+        Concurrent callers share a single refresh request.
+        
         Raises:
             AuthenticationError: If token refresh fails
         """
-        if self._token is None or self._token.is_expired:
-            await self._refresh_token()
+        if self._token is not None and not self._token.is_expired:
+            return
+        
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        
+        async with self._refresh_lock:
+            # Another caller may have refreshed the token while we waited
+            if self._token is None or self._token.is_expired:
+                await self._refresh_token()
     
     async def _refresh_token(self) -> None:
         """Refresh the OAuth2 token.
@@ -205,6 +305,7 @@ class OAuth2Auth(AuthProvider):
             
             token_data = response.json()
             self._token = OAuth2Token(**token_data)
+            self._headers = None
             
         except httpx.HTTPStatusError as e:
             error_msg = f"OAuth2 token refresh failed: {e.response.status_code}"
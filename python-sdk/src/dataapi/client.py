@@ -1,12 +1,34 @@
 """HTTP client for DataAPI SDK."""
 
 import asyncio
+import importlib.util
 import json
-from typing import Any, Dict, List, Optional, Union
+import threading
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 from urllib.parse import urljoin
+from uuid import UUID
 
 import httpx
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 from .auth import AuthProvider
 from .config import ClientConfig
@@ -19,56 +41,178 @@ from .exceptions import (
     ValidationError as DataAPIValidationError,
     create_error_from_response,
 )
-from .types import BaseDataAPIModel
+from .types import BaseDataAPIModel, construct_model, validate_list
+
+T = TypeVar("T")
+
+# HTTP/2 support in httpx needs the optional h2 package
+_HAS_H2 = importlib.util.find_spec("h2") is not None
+
+JSONSerializer = Callable[[Any], bytes]
+JSONDeserializer = Callable[[Union[bytes, str]], Any]
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize values the JSON encoder does not handle natively."""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, (UUID, Decimal)):
+        return str(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj: Any) -> bytes:
+    """Encode request payloads, using orjson when available."""
+    if isinstance(obj, BaseModel):
+        # Serialize models directly with pydantic's compiled serializer
+        return obj.model_dump_json().encode("utf-8")
+    if orjson is not None:
+        # Coerce int/enum dict keys to strings, as the stdlib encoder does
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=_json_default).encode("utf-8")
+
+
+def _loads(content: bytes) -> Any:
+    """Decode response bodies, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """Run a background event loop until stopped, then close it."""
+    try:
+        loop.run_forever()
+    finally:
+        loop.close()
 
 
 class HTTPClient:
     """HTTP client for making requests to DataAPI.
     
+    The underlying httpx clients are created on first use and kept for the
+    lifetime of this object, so all services sharing it reuse one pool of
+    keep-alive (and, when available, HTTP/2) connections. Call ``close()``
+    or ``close_async()`` to release them.
+    
+    httpx async connection pools are bound to the event loop that created
+    them, so coroutines run through ``run_sync`` use their own async client
+    on a background loop, separate from the one used by the caller's loop.
+    
     Args:
         config: Client configuration
-        auth: Authentication provider
+        auth: Authentication provider (optional for unauthenticated endpoints)
+        json_serializer: Callable encoding request payloads to bytes
+            (defaults to orjson when installed, stdlib json otherwise)
+        json_deserializer: Callable decoding response bodies
+            (defaults to orjson when installed, stdlib json otherwise)
     """
     
-    def __init__(self, config: ClientConfig, auth: AuthProvider) -> None:
+    def __init__(
+        self,
+        config: ClientConfig,
+        auth: Optional[AuthProvider] = None,
+        json_serializer: Optional[JSONSerializer] = None,
+        json_deserializer: Optional[JSONDeserializer] = None,
+    ) -> None:
         self.config = config
         self.auth = auth
+        self._dumps = json_serializer or _dumps
+        self._loads = json_deserializer or _loads
         self._client: Optional[httpx.AsyncClient] = None
         self._sync_client: Optional[httpx.Client] = None
+        # Background event loop for run_sync and the async client bound to it
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_client: Optional[httpx.AsyncClient] = None
+        self._loop_lock = threading.Lock()
     
-    def _get_headers(self) -> Dict[str, str]:
+    async def _get_headers(self) -> Dict[str, str]:
         """Get headers for requests."""
-        headers = self.config.get_headers()
-        auth_headers = self.auth.get_headers()
-        headers.update(auth_headers)
+        headers = self.config.model_dump_headers()
+        if self.auth is not None:
+            headers.update(await self.auth.get_headers())
+        return headers
+    
+    def _get_headers_sync(self) -> Dict[str, str]:
+        """Get headers for sync requests.
+        
+        Uses the auth provider's cached headers when available, and only
+        runs the async header path when a token has to be fetched.
+        """
+        headers = self.config.model_dump_headers()
+        if self.auth is not None:
+            auth_headers = self.auth.get_cached_headers()
+            if auth_headers is None:
+                auth_headers = self.run_sync(self.auth.get_headers())
+            headers.update(auth_headers)
         return headers
     
     def _build_url(self, endpoint: str) -> str:
         """Build full URL from endpoint."""
         return urljoin(self.config.base_url, endpoint.lstrip("/"))
     
-    def _handle_response(self, response: httpx.Response) -> Any:
-        """Handle HTTP response and extract data."""
+    def _handle_response(
+        self, response: httpx.Response, raw_response: bool = False
+    ) -> Any:
+        """Handle HTTP response and extract data.
+        
+        With raw_response, a successful body is decoded as JSON directly,
+        without checking the content type.
+        """
         if response.is_success:
+            if raw_response:
+                if not response.content:
+                    return None
+                try:
+                    return self._loads(response.content)
+                except ValueError as e:
+                    raise DataAPIError(f"Invalid JSON response: {e}") from e
             if response.headers.get("content-type", "").startswith("application/json"):
                 try:
-                    return response.json()
-                except json.JSONDecodeError as e:
+                    return self._loads(response.content)
+                except ValueError as e:
                     raise DataAPIError(f"Invalid JSON response: {e}") from e
             return response.text
         
         # Handle error responses
-        error = create_error_from_response(response)
-        raise error
+        try:
+            error_data = self._loads(response.content) if response.content else None
+        except ValueError:
+            error_data = None
+        if not isinstance(error_data, dict):
+            error_data = None
+        raise create_error_from_response(response.status_code, error_data)
+    
+    def _get_limits(self) -> httpx.Limits:
+        """Get connection pool limits."""
+        return httpx.Limits(
+            max_connections=self.config.max_connections,
+            max_keepalive_connections=self.config.max_keepalive_connections,
+        )
+    
+    def _new_async_client(self) -> httpx.AsyncClient:
+        """Create an async HTTP client for the running event loop."""
+        return httpx.AsyncClient(
+            timeout=self.config.timeout,
+            verify=self.config.verify_ssl,
+            follow_redirects=True,
+            limits=self._get_limits(),
+            http2=self.config.http2 and _HAS_H2,
+        )
     
     async def _get_async_client(self) -> httpx.AsyncClient:
-        """Get or create async HTTP client."""
+        """Get or create the async HTTP client for the running event loop."""
+        if self._loop is not None and asyncio.get_running_loop() is self._loop:
+            if self._loop_client is None:
+                self._loop_client = self._new_async_client()
+            return self._loop_client
         if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=self.config.timeout,
-                verify=self.config.verify_ssl,
-                follow_redirects=True,
-            )
+            self._client = self._new_async_client()
         return self._client
     
     def _get_sync_client(self) -> httpx.Client:
@@ -78,6 +222,8 @@ class HTTPClient:
                 timeout=self.config.timeout,
                 verify=self.config.verify_ssl,
                 follow_redirects=True,
+                limits=self._get_limits(),
+                http2=self.config.http2 and _HAS_H2,
             )
         return self._sync_client
     
@@ -89,30 +235,32 @@ class HTTPClient:
         json_data: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, Any]] = None,
+        raw_response: bool = False,
         retry_count: int = 0,
     ) -> Any:
         """Make async HTTP request with retry logic."""
         client = await self._get_async_client()
         url = self._build_url(endpoint)
-        headers = self._get_headers()
+        headers = await self._get_headers()
         
         try:
             response = await client.request(
                 method=method,
                 url=url,
                 params=params,
-                json=json_data,
+                content=self._dumps(json_data) if json_data is not None else None,
                 data=data,
                 files=files,
                 headers=headers,
             )
-            return self._handle_response(response)
+            return self._handle_response(response, raw_response)
         
         except httpx.TimeoutException as e:
             if retry_count < self.config.max_retries:
                 await asyncio.sleep(self.config.retry_delay * (2 ** retry_count))
                 return await self._make_request_async(
-                    method, endpoint, params, json_data, data, files, retry_count + 1
+                    method, endpoint, params, json_data, data, files, raw_response,
+                    retry_count + 1,
                 )
             raise NetworkError(f"Request timeout: {e}") from e
         
@@ -120,7 +268,8 @@ class HTTPClient:
             if retry_count < self.config.max_retries:
                 await asyncio.sleep(self.config.retry_delay * (2 ** retry_count))
                 return await self._make_request_async(
-                    method, endpoint, params, json_data, data, files, retry_count + 1
+                    method, endpoint, params, json_data, data, files, raw_response,
+                    retry_count + 1,
                 )
             raise NetworkError(f"Network error: {e}") from e
         
@@ -129,7 +278,8 @@ class HTTPClient:
                 # Exponential backoff for rate limiting
                 await asyncio.sleep(self.config.retry_delay * (2 ** retry_count))
                 return await self._make_request_async(
-                    method, endpoint, params, json_data, data, files, retry_count + 1
+                    method, endpoint, params, json_data, data, files, raw_response,
+                    retry_count + 1,
                 )
             raise
     
@@ -141,31 +291,33 @@ class HTTPClient:
         json_data: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, Any]] = None,
+        raw_response: bool = False,
         retry_count: int = 0,
     ) -> Any:
         """Make sync HTTP request with retry logic."""
         client = self._get_sync_client()
         url = self._build_url(endpoint)
-        headers = self._get_headers()
+        headers = self._get_headers_sync()
         
         try:
             response = client.request(
                 method=method,
                 url=url,
                 params=params,
-                json=json_data,
+                content=self._dumps(json_data) if json_data is not None else None,
                 data=data,
                 files=files,
                 headers=headers,
             )
-            return self._handle_response(response)
+            return self._handle_response(response, raw_response)
         
         except httpx.TimeoutException as e:
             if retry_count < self.config.max_retries:
                 import time
                 time.sleep(self.config.retry_delay * (2 ** retry_count))
                 return self._make_request_sync(
-                    method, endpoint, params, json_data, data, files, retry_count + 1
+                    method, endpoint, params, json_data, data, files, raw_response,
+                    retry_count + 1,
                 )
             raise NetworkError(f"Request timeout: {e}") from e
         
@@ -174,7 +326,8 @@ class HTTPClient:
                 import time
                 time.sleep(self.config.retry_delay * (2 ** retry_count))
                 return self._make_request_sync(
-                    method, endpoint, params, json_data, data, files, retry_count + 1
+                    method, endpoint, params, json_data, data, files, raw_response,
+                    retry_count + 1,
                 )
             raise NetworkError(f"Network error: {e}") from e
         
@@ -183,26 +336,146 @@ class HTTPClient:
                 import time
                 time.sleep(self.config.retry_delay * (2 ** retry_count))
                 return self._make_request_sync(
-                    method, endpoint, params, json_data, data, files, retry_count + 1
+                    method, endpoint, params, json_data, data, files, raw_response,
+                    retry_count + 1,
                 )
             raise
     
+    def _to_model(
+        self, response_model: type, data: Any, construct_only: bool = False
+    ) -> Any:
+        """Convert response data to response model instances."""
+        try:
+            if construct_only:
+                if isinstance(data, list):
+                    return [construct_model(response_model, item) for item in data]
+                return construct_model(response_model, data)
+            if isinstance(data, list):
+                return validate_list(response_model, data)
+            return response_model(**data)
+        except (ValidationError, TypeError) as e:
+            raise DataAPIValidationError(f"Response validation failed: {e}") from e
+    
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get or start the background event loop used by run_sync."""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=_run_loop, args=(loop,), name="dataapi-run-sync", daemon=True
+                )
+                thread.start()
+                self._loop, self._loop_thread = loop, thread
+            return self._loop
+    
+    def _detach_loop(
+        self,
+    ) -> Tuple[
+        Optional[asyncio.AbstractEventLoop],
+        Optional[threading.Thread],
+        Optional[httpx.AsyncClient],
+    ]:
+        """Detach the background loop, its thread and its async client."""
+        with self._loop_lock:
+            detached = (self._loop, self._loop_thread, self._loop_client)
+            self._loop = self._loop_thread = self._loop_client = None
+        return detached
+    
+    def _close_loop(self) -> None:
+        """Close the run_sync async client and stop its background loop.
+        
+        Blocks until the loop thread has exited.
+        
+        Raises:
+            RuntimeError: If called from a coroutine on the background loop
+        """
+        if threading.current_thread() is self._loop_thread:
+            raise RuntimeError(
+                "close() cannot be called from the client's own event loop; "
+                "use close_async() instead"
+            )
+        loop, thread, loop_client = self._detach_loop()
+        if loop is None:
+            return
+        if loop_client is not None:
+            asyncio.run_coroutine_threadsafe(loop_client.aclose(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+    
+    async def _close_loop_async(self) -> None:
+        """Close the run_sync async client and stop its background loop.
+        
+        Waits without blocking the running event loop. When run on the
+        background loop itself, the loop is stopped once this returns.
+        """
+        loop, thread, loop_client = self._detach_loop()
+        if loop is None:
+            return
+        running = asyncio.get_running_loop()
+        if running is loop:
+            if loop_client is not None:
+                await loop_client.aclose()
+            loop.call_soon(loop.stop)
+            return
+        if loop_client is not None:
+            await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(loop_client.aclose(), loop)
+            )
+        loop.call_soon_threadsafe(loop.stop)
+        await running.run_in_executor(None, thread.join)
+    
+    def run_sync(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine to completion from sync code.
+        
+        Coroutines run on a background event loop owned by this client, so
+        the pooled async HTTP client of that loop is reused across sync
+        calls. The calling thread blocks until the result is ready, which
+        also makes this safe to call while another event loop is running.
+        
+        Args:
+            coro: Coroutine to run
+            
+        Returns:
+            Result of the coroutine
+            
+        Raises:
+            RuntimeError: If called from a coroutine on the background loop
+        """
+        loop = self._get_loop()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            coro.close()
+            raise RuntimeError(
+                "Sync methods cannot be called from the client's own event loop; "
+                "use the *_async variant instead"
+            )
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+    
     # Async methods
     async def get_async(
         self,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         response_model: Optional[type] = None,
+        construct_only: bool = False,
+        raw_response: bool = False,
     ) -> Any:
-        """Make async GET request."""
-        data = await self._make_request_async("GET", endpoint, params=params)
+        """Make async GET request.
+        
+        When construct_only is set, the response model is built without
+        running validators; only use it for trusted server responses.
+        When raw_response is set, the decoded JSON body is returned as is.
+        """
+        data = await self._make_request_async(
+            "GET", endpoint, params=params, raw_response=raw_response
+        )
+        if raw_response:
+            return data
         if response_model and data:
-            try:
-                if isinstance(data, list):
-                    return [response_model(**item) for item in data]
-                return response_model(**data)
-            except (ValidationError, TypeError) as e:
-                raise DataAPIValidationError(f"Response validation failed: {e}") from e
+            return self._to_model(response_model, data, construct_only)
         return data
     
     async def post_async(
@@ -212,16 +485,27 @@ class HTTPClient:
         data: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, Any]] = None,
         response_model: Optional[type] = None,
+        construct_only: bool = False,
+        raw_response: bool = False,
     ) -> Any:
-        """Make async POST request."""
+        """Make async POST request.
+        
+        When construct_only is set, the response model is built without
+        running validators; only use it for trusted server responses.
+        When raw_response is set, the decoded JSON body is returned as is.
+        """
         response_data = await self._make_request_async(
-            "POST", endpoint, json_data=json_data, data=data, files=files
+            "POST",
+            endpoint,
+            json_data=json_data,
+            data=data,
+            files=files,
+            raw_response=raw_response,
         )
+        if raw_response:
+            return response_data
         if response_model and response_data:
-            try:
-                return response_model(**response_data)
-            except (ValidationError, TypeError) as e:
-                raise DataAPIValidationError(f"Response validation failed: {e}") from e
+            return self._to_model(response_model, response_data, construct_only)
         return response_data
     
     async def put_async(
@@ -233,10 +517,7 @@ class HTTPClient:
         """Make async PUT request."""
         data = await self._make_request_async("PUT", endpoint, json_data=json_data)
         if response_model and data:
-            try:
-                return response_model(**data)
-            except (ValidationError, TypeError) as e:
-                raise DataAPIValidationError(f"Response validation failed: {e}") from e
+            return self._to_model(response_model, data)
         return data
     
     async def patch_async(
@@ -248,10 +529,7 @@ class HTTPClient:
         """Make async PATCH request."""
         data = await self._make_request_async("PATCH", endpoint, json_data=json_data)
         if response_model and data:
-            try:
-                return response_model(**data)
-            except (ValidationError, TypeError) as e:
-                raise DataAPIValidationError(f"Response validation failed: {e}") from e
+            return self._to_model(response_model, data)
         return data
     
     async def delete_async(
@@ -262,22 +540,72 @@ class HTTPClient:
         """Make async DELETE request."""
         return await self._make_request_async("DELETE", endpoint, params=params)
     
+    async def stream_json_lines_async(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Any]:
+        """Stream a newline-delimited JSON response.
+        
+        Each line is decoded and yielded as it arrives, so the full body is
+        never held in memory. Streams are not retried.
+        
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            
+        Yields:
+            Decoded JSON value of each non-empty line
+            
+        Raises:
+            DataAPIError: If the response is an error
+            NetworkError: If the connection fails or times out
+        """
+        client = await self._get_async_client()
+        url = self._build_url(endpoint)
+        headers = await self._get_headers()
+        headers["Accept"] = "application/x-ndjson"
+        
+        try:
+            async with client.stream(
+                "GET", url, params=params, headers=headers
+            ) as response:
+                if not response.is_success:
+                    await response.aread()
+                    self._handle_response(response)
+                
+                async for line in response.aiter_lines():
+                    if line:
+                        yield self._loads(line)
+        
+        except httpx.TimeoutException as e:
+            raise NetworkError(f"Request timeout: {e}") from e
+        
+        except httpx.NetworkError as e:
+            raise NetworkError(f"Network error: {e}") from e
+    
     # Sync methods
     def get(
         self,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         response_model: Optional[type] = None,
+        construct_only: bool = False,
+        raw_response: bool = False,
     ) -> Any:
-        """Make sync GET request."""
-        data = self._make_request_sync("GET", endpoint, params=params)
+        """Make sync GET request.
+        
+        When construct_only is set, the response model is built without
+        running validators; only use it for trusted server responses.
+        When raw_response is set, the decoded JSON body is returned as is.
+        """
+        data = self._make_request_sync(
+            "GET", endpoint, params=params, raw_response=raw_response
+        )
+        if raw_response:
+            return data
         if response_model and data:
-            try:
-                if isinstance(data, list):
-                    return [response_model(**item) for item in data]
-                return response_model(**data)
-            except (ValidationError, TypeError) as e:
-                raise DataAPIValidationError(f"Response validation failed: {e}") from e
+            return self._to_model(response_model, data, construct_only)
         return data
     
     def post(
@@ -287,16 +615,27 @@ class HTTPClient:
         data: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, Any]] = None,
         response_model: Optional[type] = None,
+        construct_only: bool = False,
+        raw_response: bool = False,
     ) -> Any:
-        """Make sync POST request."""
+        """Make sync POST request.
+        
+        When construct_only is set, the response model is built without
+        running validators; only use it for trusted server responses.
+        When raw_response is set, the decoded JSON body is returned as is.
+        """
         response_data = self._make_request_sync(
-            "POST", endpoint, json_data=json_data, data=data, files=files
+            "POST",
+            endpoint,
+            json_data=json_data,
+            data=data,
+            files=files,
+            raw_response=raw_response,
         )
+        if raw_response:
+            return response_data
         if response_model and response_data:
-            try:
-                return response_model(**response_data)
-            except (ValidationError, TypeError) as e:
-                raise DataAPIValidationError(f"Response validation failed: {e}") from e
+            return self._to_model(response_model, response_data, construct_only)
         return response_data
     
     def put(
@@ -308,10 +647,7 @@ class HTTPClient:
         """Make sync PUT request."""
         data = self._make_request_sync("PUT", endpoint, json_data=json_data)
         if response_model and data:
-            try:
-                return response_model(**data)
-            except (ValidationError, TypeError) as e:
-                raise DataAPIValidationError(f"Response validation failed: {e}") from e
+            return self._to_model(response_model, data)
         return data
     
     def patch(
@@ -323,10 +659,7 @@ class HTTPClient:
         """Make sync PATCH request."""
         data = self._make_request_sync("PATCH", endpoint, json_data=json_data)
         if response_model and data:
-            try:
-                return response_model(**data)
-            except (ValidationError, TypeError) as e:
-                raise DataAPIValidationError(f"Response validation failed: {e}") from e
+            return self._to_model(response_model, data)
         return data
     
     def delete(
@@ -338,16 +671,18 @@ class HTTPClient:
         return self._make_request_sync("DELETE", endpoint, params=params)
     
     async def close_async(self) -> None:
-        """Close async HTTP client."""
+        """Close async HTTP clients."""
         if self._client:
             await self._client.aclose()
             self._client = None
+        await self._close_loop_async()
     
     def close(self) -> None:
-        """Close sync HTTP client."""
+        """Close sync HTTP client and the run_sync event loop."""
         if self._sync_client:
             self._sync_client.close()
             self._sync_client = None
+        self._close_loop()
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -14,6 +14,9 @@ class ClientConfig(BaseModel):
         retry_delay: Delay between retries in seconds
         user_agent: User agent string for requests
         verify_ssl: Whether to verify SSL certificates
+        max_connections: Maximum number of pooled connections
+        max_keepalive_connections: Maximum number of idle keep-alive connections
+        http2: Whether to use HTTP/2 (requires the ``h2`` package)
     """
     
     base_url: HttpUrl = Field(
@@ -43,6 +46,20 @@ class ClientConfig(BaseModel):
         default=True,
         description="Whether to verify SSL certificates"
     )
+    max_connections: int = Field(
+        default=100,
+        ge=1,
+        description="Maximum number of pooled connections"
+    )
+    max_keepalive_connections: int = Field(
+        default=20,
+        ge=0,
+        description="Maximum number of idle keep-alive connections"
+    )
+    http2: bool = Field(
+        default=True,
+        description="Whether to use HTTP/2 (requires the h2 package)"
+    )
     
     class Config:
         """Pydantic configuration."""
@@ -237,4 +237,7 @@ class DataAPIClient:
     
     def __repr__(self) -> str:
         """String representation of the client."""
-        return f"DataAPIClient(base_url='{self.config.base_url}')"
\ No newline at end of file
+        return (
+            f"DataAPIClient(base_url='{self.config.base_url}', "
+            f"auth={type(self.auth).__name__})"
+        )
\ No newline at end of file
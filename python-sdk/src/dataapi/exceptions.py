@@ -170,6 +170,17 @@ class ConnectionError(DataAPIError):
     pass
 
 
+class NetworkError(DataAPIError):
+    """Raised when a request fails at the transport level.
+    
+    This typically occurs when:
+    - Request times out after all retries
+    - Connection is refused or dropped
+    - DNS resolution fails
+    """
+    pass
+
+
 def create_error_from_response(
     status_code: int,
     response_data: Optional[Dict[str, Any]] = None,
@@ -9,6 +9,7 @@ from ..types import (
     AIResponse,
     PaginatedResponse,
     QueryOptions,
+    validate_list,
 )
 
 
@@ -36,7 +37,7 @@ class AIService:
         """
         params = {}
         if options:
-            params.update(options.dict(exclude_none=True))
+            params.update(options.to_params())
         
         data = await self.client.get_async(
             "/ai/models",
@@ -45,7 +46,7 @@ class AIService:
         )
         # Convert data items to AIModel objects
         if data and hasattr(data, 'data'):
-            data.data = [AIModel(**item) for item in data.data]
+            data.data = validate_list(AIModel, data.data)
         return data
     
     def list_models(self, options: Optional[QueryOptions] = None) -> PaginatedResponse:
@@ -59,7 +60,7 @@ class AIService:
         """
         params = {}
         if options:
-            params.update(options.dict(exclude_none=True))
+            params.update(options.to_params())
         
         data = self.client.get(
             "/ai/models",
@@ -68,7 +69,7 @@ class AIService:
         )
         # Convert data items to AIModel objects
         if data and hasattr(data, 'data'):
-            data.data = [AIModel(**item) for item in data.data]
+            data.data = validate_list(AIModel, data.data)
         return data
     
     async def get_model_async(self, model_id: str) -> AIModel:
@@ -113,7 +114,7 @@ class AIService:
         """
         params = {"provider": provider.value}
         if options:
-            params.update(options.dict(exclude_none=True))
+            params.update(options.to_params())
         
         data = await self.client.get_async(
             "/ai/models",
@@ -122,7 +123,7 @@ class AIService:
         )
         # Convert data items to AIModel objects
         if data and hasattr(data, 'data'):
-            data.data = [AIModel(**item) for item in data.data]
+            data.data = validate_list(AIModel, data.data)
         return data
     
     def list_models_by_provider(
@@ -139,7 +140,7 @@ class AIService:
         """
         params = {"provider": provider.value}
         if options:
-            params.update(options.dict(exclude_none=True))
+            params.update(options.to_params())
         
         data = self.client.get(
             "/ai/models",
@@ -148,7 +149,7 @@ class AIService:
         )
         # Convert data items to AIModel objects
         if data and hasattr(data, 'data'):
-            data.data = [AIModel(**item) for item in data.data]
+            data.data = validate_list(AIModel, data.data)
         return data
     
     # Text generation
@@ -410,7 +411,7 @@ class AIService:
         """
         params = {}
         if options:
-            params.update(options.dict(exclude_none=True))
+            params.update(options.to_params())
         
         data = await self.client.get_async(
             "/ai/responses",
@@ -419,7 +420,7 @@ class AIService:
         )
         # Convert data items to AIResponse objects
         if data and hasattr(data, 'data'):
-            data.data = [AIResponse(**item) for item in data.data]
+            data.data = validate_list(AIResponse, data.data)
         return data
     
     def list_responses(self, options: Optional[QueryOptions] = None) -> PaginatedResponse:
@@ -433,7 +434,7 @@ class AIService:
         """
         params = {}
         if options:
-            params.update(options.dict(exclude_none=True))
+            params.update(options.to_params())
         
         data = self.client.get(
             "/ai/responses",
@@ -442,7 +443,7 @@ class AIService:
         )
         # Convert data items to AIResponse objects
         if data and hasattr(data, 'data'):
-            data.data = [AIResponse(**item) for item in data.data]
+            data.data = validate_list(AIResponse, data.data)
         return data
     
     async def get_response_async(self, response_id: str) -> AIResponse:
@@ -10,6 +10,7 @@ from ..types import (
     QueryOptions,
     Record,
     Table,
+    validate_list,
 )
 
 
@@ -37,7 +38,7 @@ class DatabaseService:
         """
         params = {}
         if options:
-            params.update(options.dict(exclude_none=True))
+            params.update(options.to_params())
         
         data = await self.client.get_async(
             "/databases",
@@ -46,7 +47,7 @@ class DatabaseService:
         )
         # Convert data items to Database objects
         if data and hasattr(data, 'data'):
-            data.data = [Database(**item) for item in data.data]
+            data.data = validate_list(Database, data.data)
         return data
     
     def list_databases(self, options: Optional[QueryOptions] = None) -> PaginatedResponse:
@@ -60,7 +61,7 @@ class DatabaseService:
         """
         params = {}
         if options:
-            params.update(options.dict(exclude_none=True))
+            params.update(options.to_params())
         
         data = self.client.get(
             "/databases",
@@ -69,7 +70,7 @@ class DatabaseService:
         )
         # Convert data items to Database objects
         if data and hasattr(data, 'data'):
-            data.data = [Database(**item) for item in data.data]
+            data.data = validate_list(Database, data.data)
         return data
     
     async def get_database_async(self, database_id: str) -> Database:
@@ -249,7 +250,7 @@ class DatabaseService:
         """
         params = {}
         if options:
-            params.update(options.dict(exclude_none=True))
+            params.update(options.to_params())
         
         data = await self.client.get_async(
             f"/databases/{database_id}/tables",
@@ -258,7 +259,7 @@ class DatabaseService:
         )
         # Convert data items to Table objects
         if data and hasattr(data, 'data'):
-            data.data = [Table(**item) for item in data.data]
+            data.data = validate_list(Table, data.data)
         return data
     
     def list_tables(
@@ -275,7 +276,7 @@ class DatabaseService:
         """
         params = {}
         if options:
-            params.update(options.dict(exclude_none=True))
+            params.update(options.to_params())
         
         data = self.client.get(
             f"/databases/{database_id}/tables",
@@ -284,7 +285,7 @@ class DatabaseService:
         )
         # Convert data items to Table objects
         if data and hasattr(data, 'data'):
-            data.data = [Table(**item) for item in data.data]
+            data.data = validate_list(Table, data.data)
         return data
     
     async def get_table_async(self, database_id: str, table_id: str) -> Table:
@@ -486,7 +487,7 @@ class DatabaseService:
         """
         params = {}
         if options:
-            params.update(options.dict(exclude_none=True))
+            params.update(options.to_params())
         
         data = await self.client.get_async(
             f"/databases/{database_id}/tables/{table_id}/records",
@@ -495,7 +496,7 @@ class DatabaseService:
         )
         # Convert data items to Record objects
         if data and hasattr(data, 'data'):
-            data.data = [Record(**item) for item in data.data]
+            data.data = validate_list(Record, data.data)
         return data
     
     def list_records(
@@ -516,7 +517,7 @@ class DatabaseService:
         """
         params = {}
         if options:
-            params.update(options.dict(exclude_none=True))
+            params.update(options.to_params())
         
         data = self.client.get(
             f"/databases/{database_id}/tables/{table_id}/records",
@@ -525,7 +526,7 @@ class DatabaseService:
         )
         # Convert data items to Record objects
         if data and hasattr(data, 'data'):
-            data.data = [Record(**item) for item in data.data]
+            data.data = validate_list(Record, data.data)
         return data
     
     async def get_record_async(
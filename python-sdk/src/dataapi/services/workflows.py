@@ -1,43 +1,271 @@
 """Workflow service for DataAPI SDK."""
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import copy
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from pydantic import BaseModel, TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 from ..client import HTTPClient
 from ..types import (
+    BaseDataAPIModel,
     PaginatedResponse,
     QueryOptions,
     Workflow,
     WorkflowExecution,
     WorkflowStatus,
     WorkflowStep,
+    construct_model,
+    validate_list,
 )
 
+T = TypeVar("T")
+ModelT = TypeVar("ModelT", bound=BaseDataAPIModel)
+
+# Number of workflow validation results kept per service
+_VALIDATE_CACHE_SIZE = 128
+
+# Seconds a cached workflow validation result stays valid
+_VALIDATE_CACHE_TTL = 300.0
+
+# Query parameter value for each execution status
+_STATUS_VALUE: Dict[WorkflowStatus, str] = {status: status.value for status in WorkflowStatus}
+
+# Compiled once for step lists that need the full serializer
+_STEPS_ADAPTER = TypeAdapter(List[WorkflowStep])
+
+
+def _fast_dict(model: BaseModel) -> Dict[str, Any]:
+    """Convert a trusted, locally built model to a dictionary.
+    
+    Reads field values straight from the instance instead of running the
+    serializer. Nested models are converted recursively; other values are
+    left to the JSON encoder. None values are omitted.
+    
+    Args:
+        model: Model instance to convert
+        
+    Returns:
+        Dictionary of field values
+    """
+    data = {}
+    for key, value in model.__dict__.items():
+        if value is None or key.startswith("_"):
+            continue
+        if isinstance(value, BaseModel):
+            value = _fast_dict(value)
+        elif isinstance(value, list) and value and isinstance(value[0], BaseModel):
+            value = [_fast_dict(item) for item in value]
+        data[key] = value
+    return data
+
+
+def _dump_steps(steps: List[WorkflowStep]) -> List[Dict[str, Any]]:
+    """Serialize workflow steps for a request payload.
+    
+    Plain WorkflowStep instances are copied from their field values.
+    Subclasses may customize serialization and go through the compiled
+    adapter instead.
+    
+    Args:
+        steps: Workflow steps to serialize
+        
+    Returns:
+        List of step dictionaries
+    """
+    if all(type(step) is WorkflowStep for step in steps):
+        return [_fast_dict(step) for step in steps]
+    return _STEPS_ADAPTER.dump_python(steps, exclude_none=True)
+
+
+def _update_workflow_payload(
+    name: Optional[str],
+    steps: Optional[List[WorkflowStep]],
+    description: Optional[str],
+    is_active: Optional[bool],
+    metadata: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Build the request payload for a workflow update.
+    
+    Only fields that were provided are included.
+    """
+    items = {
+        "name": name,
+        "steps": _dump_steps(steps) if steps is not None else None,
+        "description": description,
+        "is_active": is_active,
+        "metadata": metadata,
+    }
+    return {key: value for key, value in items.items() if value is not None}
+
+
+def _retry_payload(from_step: Optional[str]) -> Dict[str, Any]:
+    """Build the request payload for an execution retry."""
+    return {"from_step": from_step} if from_step else {}
+
+
+def _definition_key(definition: Dict[str, Any]) -> bytes:
+    """Get a stable content hash for a workflow definition."""
+    if orjson is not None:
+        encoded = orjson.dumps(
+            definition,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            default=str,
+        )
+    else:
+        encoded = json.dumps(definition, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).digest()
+
+
+def _build_items(
+    cls: Type[ModelT], items: List[Dict[str, Any]], validate: bool = False
+) -> List[ModelT]:
+    """Convert raw list items to model instances.
+    
+    Args:
+        cls: Model class to build
+        items: Raw items from the API response
+        validate: Whether to run full validation on each item
+        
+    Returns:
+        List of model instances
+    """
+    if validate:
+        return validate_list(cls, items)
+    return [construct_model(cls, item) for item in items]
+
+
+async def _gather_limited(
+    calls: List[Callable[[], Awaitable[T]]], max_concurrency: int
+) -> List[T]:
+    """Await several calls concurrently with bounded parallelism.
+    
+    Args:
+        calls: Zero-argument callables returning awaitables
+        max_concurrency: Maximum number of calls in flight at once
+        
+    Returns:
+        Results in the same order as calls
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def run(call: Callable[[], Awaitable[T]]) -> T:
+        async with semaphore:
+            return await call()
+    
+    return await asyncio.gather(*(run(call) for call in calls))
+
+
+async def _iter_pages(
+    fetch: Callable[[QueryOptions], Awaitable[PaginatedResponse]],
+    options: Optional[QueryOptions] = None,
+) -> AsyncIterator[Any]:
+    """Iterate over the items of every page of a list endpoint.
+    
+    The next page is requested before the items of the current page are
+    yielded, so fetching page N+1 overlaps with processing page N.
+    
+    Args:
+        fetch: Callable returning one page for the given query options
+        options: Query options for the first page
+        
+    Yields:
+        Items from each page in order
+    """
+    options = options.model_copy() if options else QueryOptions()
+    task: Optional[asyncio.Future] = asyncio.ensure_future(fetch(options))
+    try:
+        while task is not None:
+            page = await task
+            task = None
+            if not page:
+                return
+            
+            if page.pagination.has_next:
+                options = options.model_copy()
+                options.page = page.pagination.page + 1
+                task = asyncio.ensure_future(fetch(options))
+            
+            for item in page.data:
+                yield item
+    finally:
+        if task is not None and not task.done():
+            task.cancel()
+
 
 class WorkflowService:
     """Service for managing workflows.
     
+    Requests go through the shared HTTP client, which keeps a persistent
+    connection pool; concurrent async calls reuse its connections.
+    
+    Workflow validation results are cached by definition content for
+    ``validate_cache_ttl`` seconds; see ``validate_workflow_async``.
+    
     Args:
         client: HTTP client instance
+        validate_cache_ttl: Seconds to reuse a validation result
+            (0 disables the cache)
     """
     
-    def __init__(self, client: HTTPClient) -> None:
+    # Endpoint path formatters
+    _URL_WORKFLOW = "/workflows/{}".format
+    _URL_WORKFLOW_EXECUTE = "/workflows/{}/execute".format
+    _URL_EXEC = "/workflow-executions/{}".format
+    _URL_EXEC_CANCEL = "/workflow-executions/{}/cancel".format
+    _URL_EXEC_RETRY = "/workflow-executions/{}/retry".format
+    _URL_EXEC_LOGS = "/workflow-executions/{}/logs".format
+    _URL_TEMPLATE_CREATE = "/workflow-templates/{}/create".format
+    
+    def __init__(
+        self, client: HTTPClient, validate_cache_ttl: float = _VALIDATE_CACHE_TTL
+    ) -> None:
         self.client = client
+        self.validate_cache_ttl = validate_cache_ttl
+        # Definition hash -> (monotonic expiry time, validation result)
+        self._validate_cache: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = (
+            OrderedDict()
+        )
+    
+    def _run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run an async implementation from a sync method."""
+        return self.client.run_sync(coro)
     
     # Workflow operations
     async def list_workflows_async(
-        self, options: Optional[QueryOptions] = None
+        self, options: Optional[QueryOptions] = None, validate: bool = False
     ) -> PaginatedResponse:
         """List all workflows.
         
         Args:
             options: Query options for filtering and pagination
+            validate: Whether to fully validate each returned item
             
         Returns:
             Paginated list of workflows
         """
-        params = {}
-        if options:
-            params.update(options.dict(exclude_none=True))
+        params = options.to_params() if options else None
         
         data = await self.client.get_async(
             "/workflows",
@@ -46,58 +274,72 @@ class WorkflowService:
         )
         # Convert data items to Workflow objects
         if data and hasattr(data, 'data'):
-            data.data = [Workflow(**item) for item in data.data]
+            object.__setattr__(data, "data", _build_items(Workflow, data.data, validate))
         return data
     
-    def list_workflows(self, options: Optional[QueryOptions] = None) -> PaginatedResponse:
+    def list_workflows(
+        self, options: Optional[QueryOptions] = None, validate: bool = False
+    ) -> PaginatedResponse:
         """List all workflows (sync).
         
         Args:
             options: Query options for filtering and pagination
+            validate: Whether to fully validate each returned item
             
         Returns:
             Paginated list of workflows
         """
-        params = {}
-        if options:
-            params.update(options.dict(exclude_none=True))
+        return self._run(self.list_workflows_async(options, validate=validate))
+    
+    def iter_workflows_async(
+        self, options: Optional[QueryOptions] = None, validate: bool = False
+    ) -> AsyncIterator[Workflow]:
+        """Iterate over workflows across all pages.
         
-        data = self.client.get(
-            "/workflows",
-            params=params,
-            response_model=PaginatedResponse,
+        Closing the iterator early cancels the pending next-page request.
+        
+        Args:
+            options: Query options for the first page
+            validate: Whether to fully validate each returned item
+            
+        Returns:
+            Async iterator of workflow objects
+        """
+        return _iter_pages(
+            lambda page_options: self.list_workflows_async(page_options, validate),
+            options,
         )
-        # Convert data items to Workflow objects
-        if data and hasattr(data, 'data'):
-            data.data = [Workflow(**item) for item in data.data]
-        return data
     
-    async def get_workflow_async(self, workflow_id: str) -> Workflow:
+    def get_workflow_async(
+        self, workflow_id: str, construct_only: bool = False
+    ) -> Coroutine[Any, Any, Workflow]:
         """Get a workflow by ID.
         
         Args:
             workflow_id: Workflow identifier
+            construct_only: Skip response validation for trusted responses
             
         Returns:
             Workflow object
         """
-        return await self.client.get_async(
-            f"/workflows/{workflow_id}",
+        return self.client.get_async(
+            self._URL_WORKFLOW(workflow_id),
             response_model=Workflow,
+            construct_only=construct_only,
         )
     
-    def get_workflow(self, workflow_id: str) -> Workflow:
+    def get_workflow(self, workflow_id: str, construct_only: bool = False) -> Workflow:
         """Get a workflow by ID (sync).
         
         Args:
             workflow_id: Workflow identifier
+            construct_only: Skip response validation for trusted responses
             
         Returns:
             Workflow object
         """
-        return self.client.get(
-            f"/workflows/{workflow_id}",
-            response_model=Workflow,
+        return self._run(
+            self.get_workflow_async(workflow_id, construct_only=construct_only)
         )
     
     async def create_workflow_async(
@@ -120,10 +362,11 @@ class WorkflowService:
         """
         data = {
             "name": name,
-            "steps": [step.dict() for step in steps],
+            "steps": _dump_steps(steps),
             "description": description,
-            "metadata": metadata or {},
         }
+        if metadata:
+            data["metadata"] = metadata
         return await self.client.post_async(
             "/workflows",
             json_data=data,
@@ -148,16 +391,13 @@ class WorkflowService:
         Returns:
             Created workflow object
         """
-        data = {
-            "name": name,
-            "steps": [step.dict() for step in steps],
-            "description": description,
-            "metadata": metadata or {},
-        }
-        return self.client.post(
-            "/workflows",
-            json_data=data,
-            response_model=Workflow,
+        return self._run(
+            self.create_workflow_async(
+                name,
+                steps=steps,
+                description=description,
+                metadata=metadata,
+            )
         )
     
     async def update_workflow_async(
@@ -182,20 +422,9 @@ class WorkflowService:
         Returns:
             Updated workflow object
         """
-        data = {}
-        if name is not None:
-            data["name"] = name
-        if steps is not None:
-            data["steps"] = [step.dict() for step in steps]
-        if description is not None:
-            data["description"] = description
-        if is_active is not None:
-            data["is_active"] = is_active
-        if metadata is not None:
-            data["metadata"] = metadata
-        
+        data = _update_workflow_payload(name, steps, description, is_active, metadata)
         return await self.client.patch_async(
-            f"/workflows/{workflow_id}",
+            self._URL_WORKFLOW(workflow_id),
             json_data=data,
             response_model=Workflow,
         )
@@ -222,31 +451,24 @@ class WorkflowService:
         Returns:
             Updated workflow object
         """
-        data = {}
-        if name is not None:
-            data["name"] = name
-        if steps is not None:
-            data["steps"] = [step.dict() for step in steps]
-        if description is not None:
-            data["description"] = description
-        if is_active is not None:
-            data["is_active"] = is_active
-        if metadata is not None:
-            data["metadata"] = metadata
-        
-        return self.client.patch(
-            f"/workflows/{workflow_id}",
-            json_data=data,
-            response_model=Workflow,
+        return self._run(
+            self.update_workflow_async(
+                workflow_id,
+                name=name,
+                steps=steps,
+                description=description,
+                is_active=is_active,
+                metadata=metadata,
+            )
         )
     
-    async def delete_workflow_async(self, workflow_id: str) -> None:
+    def delete_workflow_async(self, workflow_id: str) -> Coroutine[Any, Any, None]:
         """Delete a workflow.
         
         Args:
             workflow_id: Workflow identifier
         """
-        await self.client.delete_async(f"/workflows/{workflow_id}")
+        return self.client.delete_async(self._URL_WORKFLOW(workflow_id))
     
     def delete_workflow(self, workflow_id: str) -> None:
         """Delete a workflow (sync).
@@ -254,7 +476,21 @@ class WorkflowService:
         Args:
             workflow_id: Workflow identifier
         """
-        self.client.delete(f"/workflows/{workflow_id}")
+        self._run(self.delete_workflow_async(workflow_id))
+    
+    async def delete_workflows_async(
+        self, workflow_ids: List[str], max_concurrency: int = 10
+    ) -> None:
+        """Delete several workflows concurrently.
+        
+        Args:
+            workflow_ids: Workflow identifiers to delete
+            max_concurrency: Maximum number of requests in flight at once
+        """
+        await _gather_limited(
+            [lambda wid=wid: self.delete_workflow_async(wid) for wid in workflow_ids],
+            max_concurrency,
+        )
     
     # Workflow execution operations
     async def execute_workflow_async(
@@ -262,6 +498,7 @@ class WorkflowService:
         workflow_id: str,
         input_data: Optional[Dict[str, Any]] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        construct_only: bool = False,
     ) -> WorkflowExecution:
         """Execute a workflow.
         
@@ -269,18 +506,21 @@ class WorkflowService:
             workflow_id: Workflow identifier
             input_data: Input data for workflow execution
             metadata: Optional metadata
+            construct_only: Skip response validation for trusted responses
             
         Returns:
             Workflow execution object
         """
-        data = {
-            "input_data": input_data or {},
-            "metadata": metadata or {},
-        }
+        data: Dict[str, Any] = {}
+        if input_data:
+            data["input_data"] = input_data
+        if metadata:
+            data["metadata"] = metadata
         return await self.client.post_async(
-            f"/workflows/{workflow_id}/execute",
+            self._URL_WORKFLOW_EXECUTE(workflow_id),
             json_data=data,
             response_model=WorkflowExecution,
+            construct_only=construct_only,
         )
     
     def execute_workflow(
@@ -288,6 +528,7 @@ class WorkflowService:
         workflow_id: str,
         input_data: Optional[Dict[str, Any]] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        construct_only: bool = False,
     ) -> WorkflowExecution:
         """Execute a workflow (sync).
         
@@ -295,18 +536,77 @@ class WorkflowService:
             workflow_id: Workflow identifier
             input_data: Input data for workflow execution
             metadata: Optional metadata
+            construct_only: Skip response validation for trusted responses
             
         Returns:
             Workflow execution object
         """
-        data = {
-            "input_data": input_data or {},
-            "metadata": metadata or {},
-        }
-        return self.client.post(
-            f"/workflows/{workflow_id}/execute",
-            json_data=data,
-            response_model=WorkflowExecution,
+        return self._run(
+            self.execute_workflow_async(
+                workflow_id,
+                input_data=input_data,
+                metadata=metadata,
+                construct_only=construct_only,
+            )
+        )
+    
+    async def bulk_execute_async(
+        self,
+        workflow_ids: List[str],
+        input_data_list: Optional[List[Optional[Dict[str, Any]]]] = None,
+        max_concurrency: int = 10,
+    ) -> List[WorkflowExecution]:
+        """Execute several workflows concurrently.
+        
+        Args:
+            workflow_ids: Workflow identifiers to execute
+            input_data_list: Input data for each workflow, in the same order
+            max_concurrency: Maximum number of requests in flight at once
+            
+        Returns:
+            Workflow execution objects, in the same order as workflow_ids
+            
+        Raises:
+            ValueError: If input_data_list length doesn't match workflow_ids
+        """
+        if input_data_list is None:
+            input_data_list = [None] * len(workflow_ids)
+        elif len(input_data_list) != len(workflow_ids):
+            raise ValueError("input_data_list must match the length of workflow_ids")
+        
+        return await _gather_limited(
+            [
+                lambda wid=wid, data=data: self.execute_workflow_async(wid, data)
+                for wid, data in zip(workflow_ids, input_data_list)
+            ],
+            max_concurrency,
+        )
+    
+    def bulk_execute(
+        self,
+        workflow_ids: List[str],
+        input_data_list: Optional[List[Optional[Dict[str, Any]]]] = None,
+        max_concurrency: int = 10,
+    ) -> List[WorkflowExecution]:
+        """Execute several workflows concurrently (sync).
+        
+        Args:
+            workflow_ids: Workflow identifiers to execute
+            input_data_list: Input data for each workflow, in the same order
+            max_concurrency: Maximum number of requests in flight at once
+            
+        Returns:
+            Workflow execution objects, in the same order as workflow_ids
+            
+        Raises:
+            ValueError: If input_data_list length doesn't match workflow_ids
+        """
+        return self._run(
+            self.bulk_execute_async(
+                workflow_ids,
+                input_data_list=input_data_list,
+                max_concurrency=max_concurrency,
+            )
         )
     
     async def list_executions_async(
@@ -314,6 +614,7 @@ class WorkflowService:
         workflow_id: Optional[str] = None,
         status: Optional[WorkflowStatus] = None,
         options: Optional[QueryOptions] = None,
+        validate: bool = False,
     ) -> PaginatedResponse:
         """List workflow executions.
         
@@ -321,17 +622,18 @@ class WorkflowService:
             workflow_id: Filter by workflow ID
             status: Filter by execution status
             options: Query options for filtering and pagination
+            validate: Whether to fully validate each returned item
             
         Returns:
             Paginated list of workflow executions
         """
-        params = {}
-        if workflow_id:
-            params["workflow_id"] = workflow_id
-        if status:
-            params["status"] = status.value
+        filters = {
+            "workflow_id": workflow_id or None,
+            "status": _STATUS_VALUE[status] if status else None,
+        }
+        params = {key: value for key, value in filters.items() if value is not None}
         if options:
-            params.update(options.dict(exclude_none=True))
+            params.update(options.to_params())
         
         data = await self.client.get_async(
             "/workflow-executions",
@@ -340,7 +642,7 @@ class WorkflowService:
         )
         # Convert data items to WorkflowExecution objects
         if data and hasattr(data, 'data'):
-            data.data = [WorkflowExecution(**item) for item in data.data]
+            object.__setattr__(data, "data", _build_items(WorkflowExecution, data.data, validate))
         return data
     
     def list_executions(
@@ -348,6 +650,7 @@ class WorkflowService:
         workflow_id: Optional[str] = None,
         status: Optional[WorkflowStatus] = None,
         options: Optional[QueryOptions] = None,
+        validate: bool = False,
     ) -> PaginatedResponse:
         """List workflow executions (sync).
         
@@ -355,138 +658,209 @@ class WorkflowService:
             workflow_id: Filter by workflow ID
             status: Filter by execution status
             options: Query options for filtering and pagination
+            validate: Whether to fully validate each returned item
             
         Returns:
             Paginated list of workflow executions
         """
-        params = {}
-        if workflow_id:
-            params["workflow_id"] = workflow_id
-        if status:
-            params["status"] = status.value
-        if options:
-            params.update(options.dict(exclude_none=True))
+        return self._run(
+            self.list_executions_async(
+                workflow_id,
+                status=status,
+                options=options,
+                validate=validate,
+            )
+        )
+    
+    def iter_executions_async(
+        self,
+        workflow_id: Optional[str] = None,
+        status: Optional[WorkflowStatus] = None,
+        options: Optional[QueryOptions] = None,
+        validate: bool = False,
+    ) -> AsyncIterator[WorkflowExecution]:
+        """Iterate over workflow executions across all pages.
         
-        data = self.client.get(
-            "/workflow-executions",
-            params=params,
-            response_model=PaginatedResponse,
+        Closing the iterator early cancels the pending next-page request.
+        
+        Args:
+            workflow_id: Filter by workflow ID
+            status: Filter by execution status
+            options: Query options for the first page
+            validate: Whether to fully validate each returned item
+            
+        Returns:
+            Async iterator of workflow execution objects
+        """
+        return _iter_pages(
+            lambda page_options: self.list_executions_async(
+                workflow_id, status, page_options, validate
+            ),
+            options,
         )
-        # Convert data items to WorkflowExecution objects
-        if data and hasattr(data, 'data'):
-            data.data = [WorkflowExecution(**item) for item in data.data]
-        return data
     
-    async def get_execution_async(self, execution_id: str) -> WorkflowExecution:
+    def get_execution_async(
+        self, execution_id: str, construct_only: bool = False
+    ) -> Coroutine[Any, Any, WorkflowExecution]:
         """Get a workflow execution by ID.
         
         Args:
             execution_id: Execution identifier
+            construct_only: Skip response validation for trusted responses
             
         Returns:
             Workflow execution object
         """
-        return await self.client.get_async(
-            f"/workflow-executions/{execution_id}",
+        return self.client.get_async(
+            self._URL_EXEC(execution_id),
             response_model=WorkflowExecution,
+            construct_only=construct_only,
         )
     
-    def get_execution(self, execution_id: str) -> WorkflowExecution:
+    def get_execution(
+        self, execution_id: str, construct_only: bool = False
+    ) -> WorkflowExecution:
         """Get a workflow execution by ID (sync).
         
         Args:
             execution_id: Execution identifier
+            construct_only: Skip response validation for trusted responses
             
         Returns:
             Workflow execution object
         """
-        return self.client.get(
-            f"/workflow-executions/{execution_id}",
-            response_model=WorkflowExecution,
+        return self._run(
+            self.get_execution_async(execution_id, construct_only=construct_only)
         )
     
-    async def cancel_execution_async(self, execution_id: str) -> WorkflowExecution:
+    def cancel_execution_async(
+        self, execution_id: str, construct_only: bool = False
+    ) -> Coroutine[Any, Any, WorkflowExecution]:
         """Cancel a workflow execution.
         
         Args:
             execution_id: Execution identifier
+            construct_only: Skip response validation for trusted responses
             
         Returns:
             Updated workflow execution object
         """
-        return await self.client.post_async(
-            f"/workflow-executions/{execution_id}/cancel",
+        return self.client.post_async(
+            self._URL_EXEC_CANCEL(execution_id),
             response_model=WorkflowExecution,
+            construct_only=construct_only,
         )
     
-    def cancel_execution(self, execution_id: str) -> WorkflowExecution:
+    def cancel_execution(
+        self, execution_id: str, construct_only: bool = False
+    ) -> WorkflowExecution:
         """Cancel a workflow execution (sync).
         
         Args:
             execution_id: Execution identifier
+            construct_only: Skip response validation for trusted responses
             
         Returns:
             Updated workflow execution object
         """
-        return self.client.post(
-            f"/workflow-executions/{execution_id}/cancel",
-            response_model=WorkflowExecution,
+        return self._run(
+            self.cancel_execution_async(execution_id, construct_only=construct_only)
+        )
+    
+    async def cancel_executions_async(
+        self, execution_ids: List[str], max_concurrency: int = 10
+    ) -> List[WorkflowExecution]:
+        """Cancel several workflow executions concurrently.
+        
+        Args:
+            execution_ids: Execution identifiers to cancel
+            max_concurrency: Maximum number of requests in flight at once
+            
+        Returns:
+            Updated workflow execution objects, in the same order as execution_ids
+        """
+        return await _gather_limited(
+            [lambda eid=eid: self.cancel_execution_async(eid) for eid in execution_ids],
+            max_concurrency,
         )
     
     async def retry_execution_async(
         self,
         execution_id: str,
         from_step: Optional[str] = None,
+        construct_only: bool = False,
     ) -> WorkflowExecution:
         """Retry a failed workflow execution.
         
         Args:
             execution_id: Execution identifier
             from_step: Step ID to retry from (optional)
+            construct_only: Skip response validation for trusted responses
             
         Returns:
             New workflow execution object
         """
-        data = {}
-        if from_step:
-            data["from_step"] = from_step
-        
         return await self.client.post_async(
-            f"/workflow-executions/{execution_id}/retry",
-            json_data=data,
+            self._URL_EXEC_RETRY(execution_id),
+            json_data=_retry_payload(from_step),
             response_model=WorkflowExecution,
+            construct_only=construct_only,
         )
     
     def retry_execution(
         self,
         execution_id: str,
         from_step: Optional[str] = None,
+        construct_only: bool = False,
     ) -> WorkflowExecution:
         """Retry a failed workflow execution (sync).
         
         Args:
             execution_id: Execution identifier
             from_step: Step ID to retry from (optional)
+            construct_only: Skip response validation for trusted responses
             
         Returns:
             New workflow execution object
         """
-        data = {}
-        if from_step:
-            data["from_step"] = from_step
+        return self._run(
+            self.retry_execution_async(
+                execution_id,
+                from_step=from_step,
+                construct_only=construct_only,
+            )
+        )
+    
+    async def retry_executions_async(
+        self,
+        execution_ids: List[str],
+        from_step: Optional[str] = None,
+        max_concurrency: int = 10,
+    ) -> List[WorkflowExecution]:
+        """Retry several failed workflow executions concurrently.
         
-        return self.client.post(
-            f"/workflow-executions/{execution_id}/retry",
-            json_data=data,
-            response_model=WorkflowExecution,
+        Args:
+            execution_ids: Execution identifiers to retry
+            from_step: Step ID to retry from (optional)
+            max_concurrency: Maximum number of requests in flight at once
+            
+        Returns:
+            New workflow execution objects, in the same order as execution_ids
+        """
+        return await _gather_limited(
+            [
+                lambda eid=eid: self.retry_execution_async(eid, from_step)
+                for eid in execution_ids
+            ],
+            max_concurrency,
         )
     
-    async def get_execution_logs_async(
+    def get_execution_logs_async(
         self,
         execution_id: str,
         step_id: Optional[str] = None,
         options: Optional[QueryOptions] = None,
-    ) -> Dict[str, Any]:
+    ) -> Coroutine[Any, Any, Dict[str, Any]]:
         """Get execution logs.
         
         Args:
@@ -497,15 +871,14 @@ class WorkflowService:
         Returns:
             Execution logs
         """
-        params = {}
+        params = options.to_params() if options else None
         if step_id:
-            params["step_id"] = step_id
-        if options:
-            params.update(options.dict(exclude_none=True))
+            params = {**(params or {}), "step_id": step_id}
         
-        return await self.client.get_async(
-            f"/workflow-executions/{execution_id}/logs",
+        return self.client.get_async(
+            self._URL_EXEC_LOGS(execution_id),
             params=params,
+            raw_response=True,
         )
     
     def get_execution_logs(
@@ -524,21 +897,42 @@ class WorkflowService:
         Returns:
             Execution logs
         """
-        params = {}
-        if step_id:
-            params["step_id"] = step_id
-        if options:
-            params.update(options.dict(exclude_none=True))
+        return self._run(
+            self.get_execution_logs_async(
+                execution_id,
+                step_id=step_id,
+                options=options,
+            )
+        )
+    
+    async def stream_execution_logs_async(
+        self,
+        execution_id: str,
+        step_id: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream execution log entries as they are received.
         
-        return self.client.get(
-            f"/workflow-executions/{execution_id}/logs",
+        Unlike get_execution_logs_async, entries are parsed one at a time,
+        so memory use stays constant for long logs.
+        
+        Args:
+            execution_id: Execution identifier
+            step_id: Filter by step ID (optional)
+            
+        Yields:
+            Log entries
+        """
+        params = {"step_id": step_id} if step_id else None
+        async for entry in self.client.stream_json_lines_async(
+            self._URL_EXEC_LOGS(execution_id),
             params=params,
-        )
+        ):
+            yield entry
     
     # Workflow templates
-    async def list_templates_async(
+    def list_templates_async(
         self, options: Optional[QueryOptions] = None
-    ) -> PaginatedResponse:
+    ) -> Coroutine[Any, Any, PaginatedResponse]:
         """List workflow templates.
         
         Args:
@@ -547,11 +941,9 @@ class WorkflowService:
         Returns:
             Paginated list of workflow templates
         """
-        params = {}
-        if options:
-            params.update(options.dict(exclude_none=True))
+        params = options.to_params() if options else None
         
-        return await self.client.get_async(
+        return self.client.get_async(
             "/workflow-templates",
             params=params,
             response_model=PaginatedResponse,
@@ -566,15 +958,22 @@ class WorkflowService:
         Returns:
             Paginated list of workflow templates
         """
-        params = {}
-        if options:
-            params.update(options.dict(exclude_none=True))
+        return self._run(self.list_templates_async(options))
+    
+    def iter_templates_async(
+        self, options: Optional[QueryOptions] = None
+    ) -> AsyncIterator[Any]:
+        """Iterate over workflow templates across all pages.
         
-        return self.client.get(
-            "/workflow-templates",
-            params=params,
-            response_model=PaginatedResponse,
-        )
+        Closing the iterator early cancels the pending next-page request.
+        
+        Args:
+            options: Query options for the first page
+            
+        Returns:
+            Async iterator of workflow templates
+        """
+        return _iter_pages(self.list_templates_async, options)
     
     async def create_from_template_async(
         self,
@@ -594,13 +993,13 @@ class WorkflowService:
         Returns:
             Created workflow object
         """
-        data = {
-            "name": name,
-            "parameters": parameters or {},
-            "metadata": metadata or {},
-        }
+        data: Dict[str, Any] = {"name": name}
+        if parameters:
+            data["parameters"] = parameters
+        if metadata:
+            data["metadata"] = metadata
         return await self.client.post_async(
-            f"/workflow-templates/{template_id}/create",
+            self._URL_TEMPLATE_CREATE(template_id),
             json_data=data,
             response_model=Workflow,
         )
@@ -623,15 +1022,13 @@ class WorkflowService:
         Returns:
             Created workflow object
         """
-        data = {
-            "name": name,
-            "parameters": parameters or {},
-            "metadata": metadata or {},
-        }
-        return self.client.post(
-            f"/workflow-templates/{template_id}/create",
-            json_data=data,
-            response_model=Workflow,
+        return self._run(
+            self.create_from_template_async(
+                template_id,
+                name=name,
+                parameters=parameters,
+                metadata=metadata,
+            )
         )
     
     # Workflow validation
@@ -640,27 +1037,55 @@ class WorkflowService:
     ) -> Dict[str, Any]:
         """Validate a workflow definition.
         
+        Results are cached by definition content for
+        ``validate_cache_ttl`` seconds, so validating an unchanged
+        definition again within that window does not hit the API. A cached
+        result does not reflect server-side changes made meanwhile, such as
+        new validation rules or deleted referenced resources; call
+        ``clear_validation_cache()`` to force fresh results.
+        
         Args:
             workflow_definition: Workflow definition to validate
             
         Returns:
             Validation result
         """
-        return await self.client.post_async(
+        key = _definition_key(workflow_definition)
+        cached = self._validate_cache.get(key)
+        if cached is not None:
+            expires_at, cached_result = cached
+            if time.monotonic() < expires_at:
+                self._validate_cache.move_to_end(key)
+                return copy.deepcopy(cached_result)
+            del self._validate_cache[key]
+        
+        result = await self.client.post_async(
             "/workflows/validate",
             json_data=workflow_definition,
+            raw_response=True,
         )
+        if result is not None and self.validate_cache_ttl > 0:
+            self._validate_cache[key] = (
+                time.monotonic() + self.validate_cache_ttl,
+                copy.deepcopy(result),
+            )
+            if len(self._validate_cache) > _VALIDATE_CACHE_SIZE:
+                self._validate_cache.popitem(last=False)
+        return result
     
     def validate_workflow(self, workflow_definition: Dict[str, Any]) -> Dict[str, Any]:
         """Validate a workflow definition (sync).
         
+        Results are cached as described in ``validate_workflow_async``.
+        
         Args:
             workflow_definition: Workflow definition to validate
             
         Returns:
             Validation result
         """
-        return self.client.post(
-            "/workflows/validate",
-            json_data=workflow_definition,
-        )
\ No newline at end of file
+        return self._run(self.validate_workflow_async(workflow_definition))
+    
+    def clear_validation_cache(self) -> None:
+        """Discard all cached workflow validation results."""
+        self._validate_cache.clear()
\ No newline at end of file
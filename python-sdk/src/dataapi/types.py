@@ -1,26 +1,160 @@
 """Type definitions for DataAPI SDK."""
 
+import sys
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
-
-from pydantic import BaseModel, Field
+from functools import lru_cache
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    computed_field,
+    field_validator,
+)
+from typing_extensions import Annotated
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+ItemT = TypeVar("ItemT")
+
+# List validators, built once per item type
+_adapter_cache: Dict[Any, TypeAdapter] = {}
 
 
 class BaseDataAPIModel(BaseModel):
-    """Base model for all DataAPI types."""
+    """Base model for all DataAPI types.
+    
+    Top-level API resources are declared with ``compare_by_id=True``, e.g.
+    ``class Database(BaseDataAPIModel, compare_by_id=True)``, so instances
+    compare and hash by their unique ``id`` instead of every field. Nested
+    models such as WorkflowStep, whose IDs are only unique within their
+    parent, keep field-wise equality.
+    """
+    
+    model_config = ConfigDict(extra="forbid", use_enum_values=True, defer_build=True)
+    
+    @classmethod
+    def from_trusted_dict(cls: Type[ModelT], data: Dict[str, Any]) -> ModelT:
+        """Build an instance from trusted server data without validation.
+        
+        Args:
+            data: Raw data, e.g. from an API response
+            
+        Returns:
+            Model instance
+        """
+        return construct_model(cls, data)
+    
+    def __init_subclass__(cls, compare_by_id: bool = False, **kwargs: Any) -> None:
+        """Compare and hash resources declared with compare_by_id by their ID."""
+        super().__init_subclass__(**kwargs)
+        if compare_by_id and "__eq__" not in cls.__dict__:
+            cls.__eq__ = _eq_by_id
+            cls.__hash__ = _hash_by_id
+
+
+def _eq_by_id(self: BaseModel, other: Any) -> bool:
+    """Check two models are the same resource."""
+    if type(self) is not type(other):
+        return NotImplemented
+    return self.id == other.id
+
+
+def _hash_by_id(self: BaseModel) -> int:
+    """Hash a model by its resource ID."""
+    return hash(self.id)
+
+
+def _model_annotation(annotation: Any) -> Tuple[Optional[Type[BaseModel]], bool]:
+    """Find the model class referenced by a field annotation.
     
-    class Config:
-        """Pydantic configuration."""
-        extra = "forbid"
-        use_enum_values = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-        }
+    Returns:
+        Tuple of (model class or None, whether the field is a list of models)
+    """
+    origin = get_origin(annotation)
+    if origin is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return _model_annotation(args[0])
+        return None, False
+    if origin is list:
+        args = get_args(annotation)
+        model, _ = _model_annotation(args[0]) if args else (None, False)
+        return model, model is not None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation, False
+    return None, False
+
+
+@lru_cache(maxsize=None)
+def _nested_models(cls: Type[BaseModel]) -> Dict[str, Tuple[Type[BaseModel], bool]]:
+    """Get the nested model fields of a model class."""
+    nested = {}
+    for name, field in cls.model_fields.items():
+        model, is_list = _model_annotation(field.annotation)
+        if model is not None:
+            nested[name] = (model, is_list)
+    return nested
+
+
+def construct_model(cls: Type[ModelT], data: Dict[str, Any]) -> ModelT:
+    """Build a model from trusted data without running validators.
+    
+    Nested model fields are constructed the same way, so the result holds
+    model instances throughout as a validated model would.
+    
+    Args:
+        cls: Model class to build
+        data: Raw data, e.g. from an API response
+        
+    Returns:
+        Model instance
+    """
+    nested = _nested_models(cls)
+    if nested:
+        data = dict(data)
+        for name, (model, is_list) in nested.items():
+            value = data.get(name)
+            if value is None:
+                continue
+            if is_list:
+                data[name] = [
+                    construct_model(model, item) if isinstance(item, dict) else item
+                    for item in value
+                ]
+            elif isinstance(value, dict):
+                data[name] = construct_model(model, value)
+    return cls.model_construct(**data)
+
+
+def _intern(value: Any) -> Any:
+    """Intern string values so repeated IDs share one object."""
+    if type(value) is str:
+        return sys.intern(value)
+    return value
+
+
+# Parent and owner IDs repeated across many objects in one response
+_SharedId = Annotated[str, BeforeValidator(_intern)]
 
 
 # Database Types
-class Database(BaseDataAPIModel):
+class Database(BaseDataAPIModel, compare_by_id=True):
     """Database model.
     
     Args:
@@ -38,7 +172,7 @@ class Database(BaseDataAPIModel):
     description: Optional[str] = None
     created_at: datetime
     updated_at: datetime
-    owner_id: str
+    owner_id: _SharedId
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
@@ -76,7 +210,7 @@ class ColumnDefinition(BaseDataAPIModel):
     description: Optional[str] = None
 
 
-class Table(BaseDataAPIModel):
+class Table(BaseDataAPIModel, compare_by_id=True):
     """Table model.
     
     Args:
@@ -93,16 +227,30 @@ class Table(BaseDataAPIModel):
     
     id: str
     name: str
-    database_id: str
+    database_id: _SharedId
     schema: List[ColumnDefinition]
     description: Optional[str] = None
     created_at: datetime
     updated_at: datetime
     row_count: int = 0
     metadata: Dict[str, Any] = Field(default_factory=dict)
-
-
-class Record(BaseDataAPIModel):
+    
+    def get_column(self, name: str) -> Optional[ColumnDefinition]:
+        """Get a column definition by name.
+        
+        Args:
+            name: Column name
+            
+        Returns:
+            Column definition, or None if the table has no such column
+        """
+        for column in self.schema:
+            if column.name == name:
+                return column
+        return None
+
+
+class Record(BaseDataAPIModel, compare_by_id=True):
     """Record model.
     
     Args:
@@ -115,7 +263,7 @@ class Record(BaseDataAPIModel):
     """
     
     id: str
-    table_id: str
+    table_id: _SharedId
     data: Dict[str, Any]
     created_at: datetime
     updated_at: datetime
@@ -130,7 +278,7 @@ class UserRole(str, Enum):
     VIEWER = "viewer"
 
 
-class User(BaseDataAPIModel):
+class User(BaseDataAPIModel, compare_by_id=True):
     """User model.
     
     Args:
@@ -154,7 +302,7 @@ class User(BaseDataAPIModel):
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
-class Project(BaseDataAPIModel):
+class Project(BaseDataAPIModel, compare_by_id=True):
     """Project model.
     
     Args:
@@ -172,7 +320,7 @@ class Project(BaseDataAPIModel):
     id: str
     name: str
     description: Optional[str] = None
-    owner_id: str
+    owner_id: _SharedId
     created_at: datetime
     updated_at: datetime
     is_active: bool = True
@@ -190,7 +338,7 @@ class AIProvider(str, Enum):
     HUGGINGFACE = "huggingface"
 
 
-class AIModel(BaseDataAPIModel):
+class AIModel(BaseDataAPIModel, compare_by_id=True):
     """AI model definition.
     
     Args:
@@ -216,7 +364,7 @@ class AIModel(BaseDataAPIModel):
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
-class AIResponse(BaseDataAPIModel):
+class AIResponse(BaseDataAPIModel, compare_by_id=True):
     """AI response model.
     
     Args:
@@ -231,7 +379,7 @@ class AIResponse(BaseDataAPIModel):
     """
     
     id: str
-    model_id: str
+    model_id: _SharedId
     prompt: str
     response: str
     tokens_used: int
@@ -270,7 +418,7 @@ class WorkflowStep(BaseDataAPIModel):
     depends_on: List[str] = Field(default_factory=list)
 
 
-class Workflow(BaseDataAPIModel):
+class Workflow(BaseDataAPIModel, compare_by_id=True):
     """Workflow model.
     
     Args:
@@ -291,12 +439,12 @@ class Workflow(BaseDataAPIModel):
     steps: List[WorkflowStep]
     created_at: datetime
     updated_at: datetime
-    owner_id: str
+    owner_id: _SharedId
     is_active: bool = True
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
-class WorkflowExecution(BaseDataAPIModel):
+class WorkflowExecution(BaseDataAPIModel, compare_by_id=True):
     """Workflow execution model.
     
     Args:
@@ -311,7 +459,7 @@ class WorkflowExecution(BaseDataAPIModel):
     """
     
     id: str
-    workflow_id: str
+    workflow_id: _SharedId
     status: WorkflowStatus
     started_at: datetime
     completed_at: Optional[datetime] = None
@@ -324,35 +472,76 @@ class WorkflowExecution(BaseDataAPIModel):
 class PageInfo(BaseDataAPIModel):
     """Pagination information.
     
+    ``total_pages``, ``has_next`` and ``has_prev`` are derived from the
+    other fields; values for them in the payload are ignored.
+    
     Args:
         page: Current page number
         per_page: Items per page
         total: Total number of items
-        total_pages: Total number of pages
-        has_next: Whether there is a next page
-        has_prev: Whether there is a previous page
     """
     
+    model_config = ConfigDict(extra="ignore")
+    
     page: int
     per_page: int
     total: int
-    total_pages: int
-    has_next: bool
-    has_prev: bool
+    
+    @computed_field
+    @property
+    def total_pages(self) -> int:
+        """Total number of pages."""
+        if self.per_page <= 0:
+            return 0
+        return -(-self.total // self.per_page)
+    
+    @computed_field
+    @property
+    def has_next(self) -> bool:
+        """Whether there is a next page."""
+        return self.page < self.total_pages
+    
+    @computed_field
+    @property
+    def has_prev(self) -> bool:
+        """Whether there is a previous page."""
+        return self.page > 1
 
 
-class PaginatedResponse(BaseDataAPIModel):
+class PaginatedResponse(BaseDataAPIModel, Generic[ItemT]):
     """Paginated response model.
     
+    Parametrize with the item type, e.g. ``PaginatedResponse[Record]``, to
+    validate items on receipt. The bare class keeps items as raw data.
+    
     Args:
         data: List of items
         pagination: Pagination information
     """
     
-    data: List[Any]
+    data: List[ItemT]
     pagination: PageInfo
 
 
+def validate_list(item_type: Type[ItemT], items: List[Any]) -> List[ItemT]:
+    """Validate a list of raw items in a single pass.
+    
+    The TypeAdapter for each item type is built on first use and reused
+    afterwards, so the validation schema is only compiled once.
+    
+    Args:
+        item_type: Type of each item
+        items: Raw items, e.g. from an API response
+        
+    Returns:
+        List of validated items
+    """
+    adapter = _adapter_cache.get(item_type)
+    if adapter is None:
+        adapter = _adapter_cache[item_type] = TypeAdapter(List[item_type])
+    return adapter.validate_python(items)
+
+
 # Query Types
 class SortOrder(str, Enum):
     """Sort order options."""
@@ -400,6 +589,18 @@ class Filter(BaseDataAPIModel):
     field: str
     operator: FilterOperator
     value: Optional[Union[str, int, float, bool, List[Any]]] = None
+    
+    @field_validator("value", mode="plain")
+    @classmethod
+    def _check_value(cls, value: Any) -> Any:
+        """Accept filter values by type instead of trying each union member."""
+        if value is None or isinstance(value, (str, int, float, list)):
+            return value
+        if isinstance(value, (tuple, set, frozenset)):
+            return list(value)
+        raise ValueError(
+            "Filter value must be a string, number, boolean, list or None"
+        )
 
 
 class QueryOptions(BaseDataAPIModel):
@@ -417,4 +618,16 @@ class QueryOptions(BaseDataAPIModel):
     per_page: int = Field(default=20, ge=1, le=100)
     sort: List[SortField] = Field(default_factory=list)
     filters: List[Filter] = Field(default_factory=list)
-    search: Optional[str] = None
\ No newline at end of file
+    search: Optional[str] = None
+    
+    def to_params(self) -> Dict[str, Any]:
+        """Get request query parameters for these options.
+        
+        Built from the current field values on every call, so in-place
+        changes to ``sort`` or ``filters`` are always reflected. Each call
+        returns a new dictionary the caller may modify.
+        
+        Returns:
+            Dictionary of non-null query parameters
+        """
+        return self.model_dump(exclude_none=True)
\ No newline at end of file
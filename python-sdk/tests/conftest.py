@@ -0,0 +1,192 @@
+"""Shared fixtures for DataAPI SDK tests."""
+
+import socket
+from datetime import datetime
+
+import pytest
+
+from dataapi.auth import APIKeyAuth, BearerTokenAuth
+from dataapi.client import HTTPClient
+from dataapi.config import ClientConfig
+
+
+class FakeMethod:
+    """Stand-in for one synchronous client method.
+    
+    Mirrors the parts of the Mock API the tests use: ``return_value``,
+    ``side_effect`` (an exception or a list of results/exceptions),
+    ``call_args``, ``call_count``, ``assert_called_once`` and
+    ``assert_called_once_with``.
+    """
+    
+    def __init__(self):
+        self.return_value = None
+        self.side_effect = None
+        self.call_args_list = []
+        self._effects = None
+    
+    @property
+    def call_count(self):
+        return len(self.call_args_list)
+    
+    @property
+    def call_args(self):
+        return self.call_args_list[-1] if self.call_args_list else None
+    
+    def assert_called_once(self):
+        assert self.call_count == 1, f"Expected 1 call, got {self.call_count}"
+    
+    def assert_called_once_with(self, *args, **kwargs):
+        self.assert_called_once()
+        assert self.call_args == (args, kwargs), f"Called with {self.call_args}"
+    
+    def _invoke(self, args, kwargs):
+        self.call_args_list.append((args, kwargs))
+        result = self.side_effect
+        if isinstance(result, (list, tuple)):
+            if self._effects is None:
+                self._effects = iter(result)
+            result = next(self._effects)
+        elif result is None:
+            result = self.return_value
+        if isinstance(result, BaseException):
+            raise result
+        return result
+    
+    def __call__(self, *args, **kwargs):
+        return self._invoke(args, kwargs)
+
+
+class FakeAsyncMethod(FakeMethod):
+    """Awaitable stand-in for one async client method."""
+    
+    async def __call__(self, *args, **kwargs):
+        return self._invoke(args, kwargs)
+
+
+class FakeHTTP:
+    """Stand-in for httpx.Client without Mock machinery.
+    
+    HTTPClient sends every request through ``request(method=..., url=...)``,
+    so that is the only transport method faked.
+    """
+    
+    method_class = FakeMethod
+    
+    def __init__(self):
+        self.request = self.method_class()
+    
+    def close(self):
+        pass
+
+
+class FakeAsyncHTTP(FakeHTTP):
+    """Stand-in for httpx.AsyncClient without Mock machinery."""
+    
+    method_class = FakeAsyncMethod
+    
+    async def aclose(self):
+        pass
+
+
+# ClientConfig is frozen, so one default instance can be shared by every test.
+_DEFAULT_CONFIG = ClientConfig()
+
+
+@pytest.fixture(scope="session")
+def config():
+    """Default client configuration."""
+    return _DEFAULT_CONFIG
+
+
+@pytest.fixture(scope="session")
+def frozen_now():
+    """Fixed timestamp for model fields that only need some datetime."""
+    return datetime(2024, 1, 1, 0, 0, 0)
+
+
+@pytest.fixture(scope="module")
+def api_key_auth():
+    """API key authentication provider."""
+    return APIKeyAuth(api_key="test-key")
+
+
+@pytest.fixture(scope="module")
+def bearer_auth():
+    """Bearer token authentication provider."""
+    return BearerTokenAuth(token="test-token")
+
+
+@pytest.fixture
+def client(config, api_key_auth):
+    """HTTP client for sync tests, closed after each test."""
+    http_client = HTTPClient(config=config, auth=api_key_auth)
+    yield http_client
+    http_client.close()
+
+
+@pytest.fixture(scope="module")
+def shared_sync_client(config, api_key_auth):
+    """HTTP client shared by the sync tests of a module."""
+    http_client = HTTPClient(config=config, auth=api_key_auth)
+    yield http_client
+    http_client.close()
+
+
+@pytest.fixture
+def mock_sync_http(shared_sync_client, monkeypatch):
+    """Fake httpx.Client wired into the shared_sync_client fixture."""
+    mock = FakeHTTP()
+    monkeypatch.setattr(shared_sync_client, "_get_sync_client", lambda: mock)
+    return mock
+
+
+@pytest.fixture(scope="module")
+async def aclient(config, api_key_auth):
+    """HTTP client shared by the async tests of a module.
+    
+    Closed once at module teardown; tests patch its attributes through the
+    function-scoped ``monkeypatch`` fixture, which restores them afterwards.
+    """
+    http_client = HTTPClient(config=config, auth=api_key_auth)
+    yield http_client
+    await http_client.close_async()
+
+
+@pytest.fixture
+def mock_async_http(aclient, monkeypatch):
+    """Fake httpx.AsyncClient wired into the aclient fixture."""
+    mock = FakeAsyncHTTP()
+    
+    async def get_async_client():
+        return mock
+    
+    monkeypatch.setattr(aclient, "_get_async_client", get_async_client)
+    return mock
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """Make retry back-off sleeps return immediately."""
+    async def instant_sleep(*args, **kwargs):
+        return None
+    
+    monkeypatch.setattr("asyncio.sleep", instant_sleep)
+    monkeypatch.setattr("time.sleep", lambda *args, **kwargs: None)
+
+
+@pytest.fixture(autouse=True)
+def _no_network(request, monkeypatch):
+    """Fail fast if a test opens a real network connection.
+    
+    Only outbound ``connect`` is blocked, so event loops can still create
+    their internal socket pairs. Tests marked ``network`` are exempt.
+    """
+    if request.node.get_closest_marker("network"):
+        return
+    
+    def guard(*args, **kwargs):
+        raise RuntimeError("Network access is disabled in tests; mock the transport")
+    
+    monkeypatch.setattr(socket.socket, "connect", guard)
+    monkeypatch.setattr(socket.socket, "connect_ex", guard)
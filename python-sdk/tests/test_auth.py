@@ -1,12 +1,80 @@
 """Tests for authentication module."""
 
+import asyncio
 import pytest
-from unittest.mock import Mock, patch
-from datetime import datetime, timedelta
+import httpx
+import respx
+from types import SimpleNamespace
+from urllib.parse import parse_qs
 
+from dataapi import auth as auth_module
 from dataapi.auth import APIKeyAuth, BearerTokenAuth, OAuth2Auth, OAuth2Token
 from dataapi.exceptions import AuthenticationError
 
+TOKEN_URL = "https://auth.example.com/token"
+
+
+@pytest.fixture(scope="module")
+def auth_router():
+    """Route token requests for the whole module through one respx router."""
+    with respx.mock(assert_all_called=False) as router:
+        router.post(TOKEN_URL, name="token")
+        yield router
+
+
+@pytest.fixture
+def token_route(auth_router):
+    """Token endpoint route, reset for each test."""
+    auth_router.reset()
+    return auth_router.routes["token"]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock for token expiry."""
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(
+        auth_module, "time", SimpleNamespace(monotonic=lambda: now.value)
+    )
+    return now
+
+
+@pytest.fixture
+async def oauth2_auth():
+    """OAuth2 provider without a token, closed after each test."""
+    auth = OAuth2Auth(
+        client_id="client-id",
+        client_secret="client-secret",
+        token_url=TOKEN_URL
+    )
+    yield auth
+    await auth.close()
+
+
+def _token_response(access_token: str) -> httpx.Response:
+    """Token endpoint response issuing access_token for one hour."""
+    return httpx.Response(200, json={
+        "access_token": access_token,
+        "token_type": "Bearer",
+        "expires_in": 3600,
+    })
+
+
+def _slow_token_endpoint(*access_tokens: str):
+    """Token endpoint side effect that yields to other tasks before responding.
+    
+    Gives concurrent callers the chance to start their own refresh while the
+    first token request is still in flight.
+    """
+    responses = iter(access_tokens)
+    
+    async def respond(request):
+        for _ in range(5):
+            await asyncio.sleep(0)
+        return _token_response(next(responses))
+    
+    return respond
+
 
 class TestAPIKeyAuth:
     """Test cases for APIKeyAuth class."""
@@ -14,12 +82,13 @@ class TestAPIKeyAuth:
     def test_api_key_auth_creation(self):
         """Test API key authentication creation."""
         auth = APIKeyAuth(api_key="test-api-key")
-        assert auth.api_key == "test-api-key"
+        assert auth.api_key.get_secret_value() == "test-api-key"
+        assert "test-api-key" not in repr(auth.api_key)
     
-    def test_api_key_auth_headers(self):
+    async def test_api_key_auth_headers(self):
         """Test API key authentication headers."""
         auth = APIKeyAuth(api_key="test-api-key")
-        headers = auth.get_auth_headers()
+        headers = await auth.get_headers()
         
         assert "X-API-Key" in headers
         assert headers["X-API-Key"] == "test-api-key"
@@ -41,12 +110,12 @@ class TestBearerTokenAuth:
     def test_bearer_token_auth_creation(self):
         """Test bearer token authentication creation."""
         auth = BearerTokenAuth(token="test-bearer-token")
-        assert auth.token == "test-bearer-token"
+        assert auth.token.get_secret_value() == "test-bearer-token"
     
-    def test_bearer_token_auth_headers(self):
+    async def test_bearer_token_auth_headers(self):
         """Test bearer token authentication headers."""
         auth = BearerTokenAuth(token="test-bearer-token")
-        headers = auth.get_auth_headers()
+        headers = await auth.get_headers()
         
         assert "Authorization" in headers
         assert headers["Authorization"] == "Bearer test-bearer-token"
@@ -67,218 +136,179 @@ class TestOAuth2Token:
     
     def test_oauth2_token_creation(self):
         """Test OAuth2 token creation."""
-        expires_at = datetime.utcnow() + timedelta(hours=1)
         token = OAuth2Token(
             access_token="access-token",
             token_type="Bearer",
-            expires_at=expires_at,
+            expires_in=3600,
             refresh_token="refresh-token"
         )
         
-        assert token.access_token == "access-token"
+        assert token.access_token.get_secret_value() == "access-token"
         assert token.token_type == "Bearer"
-        assert token.expires_at == expires_at
-        assert token.refresh_token == "refresh-token"
+        assert token.expires_in == 3600
+        assert token.refresh_token.get_secret_value() == "refresh-token"
     
-    def test_oauth2_token_is_expired_false(self):
+    def test_oauth2_token_is_expired_false(self, clock):
         """Test OAuth2 token expiration check when not expired."""
-        expires_at = datetime.utcnow() + timedelta(hours=1)
-        token = OAuth2Token(
-            access_token="access-token",
-            token_type="Bearer",
-            expires_at=expires_at
-        )
+        token = OAuth2Token(access_token="access-token", expires_in=3600)
+        clock.value += 3000
         
-        assert not token.is_expired()
+        assert not token.is_expired
     
-    def test_oauth2_token_is_expired_true(self):
+    def test_oauth2_token_is_expired_true(self, clock):
         """Test OAuth2 token expiration check when expired."""
-        expires_at = datetime.utcnow() - timedelta(hours=1)
-        token = OAuth2Token(
-            access_token="access-token",
-            token_type="Bearer",
-            expires_at=expires_at
-        )
+        token = OAuth2Token(access_token="access-token", expires_in=3600)
+        clock.value += 3600
         
-        assert token.is_expired()
+        assert token.is_expired
     
-    def test_oauth2_token_is_expired_buffer(self):
+    def test_oauth2_token_is_expired_buffer(self, clock):
         """Test OAuth2 token expiration check with buffer."""
-        # Token expires in 4 minutes (less than 5 minute buffer)
-        expires_at = datetime.utcnow() + timedelta(minutes=4)
-        token = OAuth2Token(
-            access_token="access-token",
-            token_type="Bearer",
-            expires_at=expires_at
-        )
+        token = OAuth2Token(access_token="access-token", expires_in=3600)
+        # Within the 60 second buffer before the real expiry
+        clock.value += 3590 - 60
+        assert not token.is_expired
         
-        assert token.is_expired()  # Should be considered expired due to buffer
+        clock.value += 10
+        assert token.is_expired
     
-    def test_oauth2_token_no_expiration(self):
+    def test_oauth2_token_no_expiration(self, clock):
         """Test OAuth2 token without expiration."""
-        token = OAuth2Token(
-            access_token="access-token",
-            token_type="Bearer"
-        )
+        token = OAuth2Token(access_token="access-token", token_type="Bearer")
+        clock.value += 10 ** 9
         
-        assert not token.is_expired()
+        assert not token.is_expired
 
 
 class TestOAuth2Auth:
     """Test cases for OAuth2Auth class."""
     
-    def test_oauth2_auth_creation(self):
+    async def test_oauth2_auth_creation(self, oauth2_auth):
         """Test OAuth2 authentication creation."""
-        auth = OAuth2Auth(
-            client_id="client-id",
-            client_secret="client-secret",
-            token_url="https://auth.example.com/token"
-        )
-        
-        assert auth.client_id == "client-id"
-        assert auth.client_secret == "client-secret"
-        assert auth.token_url == "https://auth.example.com/token"
-        assert auth.token is None
+        assert oauth2_auth.client_id == "client-id"
+        assert oauth2_auth.client_secret.get_secret_value() == "client-secret"
+        assert oauth2_auth.token_url == TOKEN_URL
+        assert oauth2_auth.scope is None
     
-    def test_oauth2_auth_with_token(self):
-        """Test OAuth2 authentication with existing token."""
-        token = OAuth2Token(
-            access_token="access-token",
-            token_type="Bearer",
-            expires_at=datetime.utcnow() + timedelta(hours=1)
-        )
-        
+    async def test_oauth2_auth_headers_with_valid_token(self, token_route):
+        """Test OAuth2 authentication headers with an existing valid token."""
+        token = OAuth2Token(access_token="access-token", expires_in=3600)
         auth = OAuth2Auth(
             client_id="client-id",
             client_secret="client-secret",
-            token_url="https://auth.example.com/token",
+            token_url=TOKEN_URL,
             token=token
         )
         
-        assert auth.token == token
-    
-    def test_oauth2_auth_headers_with_valid_token(self):
-        """Test OAuth2 authentication headers with valid token."""
-        token = OAuth2Token(
-            access_token="access-token",
-            token_type="Bearer",
-            expires_at=datetime.utcnow() + timedelta(hours=1)
-        )
+        headers = await auth.get_headers()
+        await auth.close()
         
-        auth = OAuth2Auth(
-            client_id="client-id",
-            client_secret="client-secret",
-            token_url="https://auth.example.com/token",
-            token=token
-        )
-        
-        headers = auth.get_auth_headers()
-        assert "Authorization" in headers
-        assert headers["Authorization"] == "Bearer access-token"
+        assert headers == {"Authorization": "Bearer access-token"}
+        assert token_route.call_count == 0
     
-    def test_oauth2_auth_headers_no_token(self):
-        """Test OAuth2 authentication headers without token."""
-        auth = OAuth2Auth(
-            client_id="client-id",
-            client_secret="client-secret",
-            token_url="https://auth.example.com/token"
-        )
+    async def test_oauth2_auth_fetches_token_without_one(self, oauth2_auth, token_route):
+        """Test a provider without a token requests one with client credentials."""
+        token_route.side_effect = [_token_response("issued-token")]
         
-        with pytest.raises(AuthenticationError, match="No valid OAuth2 token available"):
-            auth.get_auth_headers()
-    
-    def test_oauth2_auth_headers_expired_token_no_refresh(self):
-        """Test OAuth2 authentication headers with expired token and no refresh token."""
-        token = OAuth2Token(
-            access_token="access-token",
-            token_type="Bearer",
-            expires_at=datetime.utcnow() - timedelta(hours=1)
-        )
+        headers = await oauth2_auth.get_headers()
         
+        assert headers["Authorization"] == "Bearer issued-token"
+        form = parse_qs(token_route.calls.last.request.content.decode())
+        assert form["grant_type"] == ["client_credentials"]
+        assert form["client_id"] == ["client-id"]
+        assert form["client_secret"] == ["client-secret"]
+    
+    async def test_oauth2_auth_expired_token_no_refresh(self, token_route, clock):
+        """Test an expired token without refresh token falls back to client credentials."""
+        token_route.side_effect = [_token_response("new-access-token")]
+        token = OAuth2Token(access_token="old-access-token", expires_in=3600)
         auth = OAuth2Auth(
             client_id="client-id",
             client_secret="client-secret",
-            token_url="https://auth.example.com/token",
+            token_url=TOKEN_URL,
+            scope="read",
             token=token
         )
+        clock.value += 3600
         
-        with pytest.raises(AuthenticationError, match="OAuth2 token has expired and no refresh token available"):
-            auth.get_auth_headers()
+        headers = await auth.get_headers()
+        await auth.close()
+        
+        assert headers["Authorization"] == "Bearer new-access-token"
+        form = parse_qs(token_route.calls.last.request.content.decode())
+        assert form["grant_type"] == ["client_credentials"]
+        assert form["scope"] == ["read"]
     
-    @patch('httpx.post')
-    def test_oauth2_refresh_token_success(self, mock_post):
+    async def test_oauth2_refresh_token_success(self, token_route, clock):
         """Test successful OAuth2 token refresh."""
-        # Mock successful refresh response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        token_route.mock(return_value=httpx.Response(200, json={
             "access_token": "new-access-token",
             "token_type": "Bearer",
             "expires_in": 3600,
             "refresh_token": "new-refresh-token"
-        }
-        mock_post.return_value = mock_response
+        }))
         
         # Create expired token with refresh token
         expired_token = OAuth2Token(
             access_token="old-access-token",
             token_type="Bearer",
-            expires_at=datetime.utcnow() - timedelta(hours=1),
+            expires_in=3600,
             refresh_token="old-refresh-token"
         )
+        clock.value += 3600
         
         auth = OAuth2Auth(
             client_id="client-id",
             client_secret="client-secret",
-            token_url="https://auth.example.com/token",
+            token_url=TOKEN_URL,
             token=expired_token
         )
         
         # This should trigger token refresh
-        headers = auth.get_auth_headers()
+        headers = await auth.get_headers()
+        await auth.close()
         
         # Verify the new token is used
         assert headers["Authorization"] == "Bearer new-access-token"
-        assert auth.token.access_token == "new-access-token"
-        assert auth.token.refresh_token == "new-refresh-token"
         
         # Verify the refresh request was made
-        mock_post.assert_called_once()
-        call_args = mock_post.call_args
-        assert call_args[0][0] == "https://auth.example.com/token"
-        assert call_args[1]["data"]["grant_type"] == "refresh_token"
-        assert call_args[1]["data"]["refresh_token"] == "old-refresh-token"
-    
-    @patch('httpx.post')
-    def test_oauth2_refresh_token_failure(self, mock_post):
+        assert token_route.call_count == 1
+        request = token_route.calls.last.request
+        assert str(request.url) == TOKEN_URL
+        form = parse_qs(request.content.decode())
+        assert form["grant_type"] == ["refresh_token"]
+        assert form["refresh_token"] == ["old-refresh-token"]
+    
+    async def test_oauth2_refresh_token_failure(self, token_route, clock):
         """Test failed OAuth2 token refresh."""
-        # Mock failed refresh response
-        mock_response = Mock()
-        mock_response.status_code = 400
-        mock_response.json.return_value = {
+        token_route.mock(return_value=httpx.Response(400, json={
             "error": "invalid_grant",
             "error_description": "The refresh token is invalid"
-        }
-        mock_post.return_value = mock_response
+        }))
         
         # Create expired token with refresh token
         expired_token = OAuth2Token(
             access_token="old-access-token",
             token_type="Bearer",
-            expires_at=datetime.utcnow() - timedelta(hours=1),
+            expires_in=3600,
             refresh_token="old-refresh-token"
         )
+        clock.value += 3600
         
         auth = OAuth2Auth(
             client_id="client-id",
             client_secret="client-secret",
-            token_url="https://auth.example.com/token",
+            token_url=TOKEN_URL,
             token=expired_token
         )
         
         # This should raise an authentication error
-        with pytest.raises(AuthenticationError, match="Failed to refresh OAuth2 token"):
-            auth.get_auth_headers()
+        with pytest.raises(
+            AuthenticationError,
+            match="OAuth2 token refresh failed: 400 - The refresh token is invalid",
+        ):
+            await auth.get_headers()
+        await auth.close()
     
     def test_oauth2_auth_empty_client_id(self):
         """Test OAuth2 authentication with empty client ID."""
@@ -286,7 +316,7 @@ class TestOAuth2Auth:
             OAuth2Auth(
                 client_id="",
                 client_secret="client-secret",
-                token_url="https://auth.example.com/token"
+                token_url=TOKEN_URL
             )
     
     def test_oauth2_auth_empty_client_secret(self):
@@ -295,7 +325,7 @@ class TestOAuth2Auth:
             OAuth2Auth(
                 client_id="client-id",
                 client_secret="",
-                token_url="https://auth.example.com/token"
+                token_url=TOKEN_URL
             )
     
     def test_oauth2_auth_invalid_token_url(self):
@@ -305,4 +335,97 @@ class TestOAuth2Auth:
                 client_id="client-id",
                 client_secret="client-secret",
                 token_url="not-a-url"
-            )
\ No newline at end of file
+            )
+
+
+class TestPrebuiltHeaders:
+    """Test cases for reusing authentication headers across requests."""
+    
+    async def test_api_key_headers_reused(self):
+        """Test API key headers are built once and shared."""
+        auth = APIKeyAuth(api_key="test-api-key", header_name="X-Custom-Key")
+        
+        headers = await auth.get_headers()
+        
+        assert headers == {"X-Custom-Key": "test-api-key"}
+        assert await auth.get_headers() is headers
+    
+    async def test_bearer_headers_reused(self):
+        """Test bearer token headers are built once and shared."""
+        auth = BearerTokenAuth(token="test-bearer-token")
+        
+        headers = await auth.get_headers()
+        
+        assert headers == {"Authorization": "Bearer test-bearer-token"}
+        assert await auth.get_headers() is headers
+    
+    async def test_oauth2_headers_reused_until_refresh(
+        self, oauth2_auth, token_route, clock
+    ):
+        """Test OAuth2 headers are shared per token and rebuilt after refresh."""
+        token_route.side_effect = [_token_response("first"), _token_response("second")]
+        
+        headers = await oauth2_auth.get_headers()
+        assert headers == {"Authorization": "Bearer first"}
+        assert await oauth2_auth.get_headers() is headers
+        
+        clock.value += 3600
+        refreshed = await oauth2_auth.get_headers()
+        
+        assert refreshed == {"Authorization": "Bearer second"}
+        assert headers == {"Authorization": "Bearer first"}
+        assert token_route.call_count == 2
+    
+    @pytest.mark.parametrize("auth", [
+        APIKeyAuth(api_key="test-api-key"),
+        BearerTokenAuth(token="test-bearer-token"),
+    ], ids=["api_key", "bearer"])
+    async def test_static_cached_headers(self, auth):
+        """Test static providers expose their prebuilt headers synchronously."""
+        assert auth.get_cached_headers() is await auth.get_headers()
+    
+    async def test_oauth2_cached_headers(self, oauth2_auth, token_route, clock):
+        """Test OAuth2 cached headers are only available for a valid token."""
+        token_route.side_effect = [_token_response("first")]
+        assert oauth2_auth.get_cached_headers() is None
+        
+        headers = await oauth2_auth.get_headers()
+        assert oauth2_auth.get_cached_headers() is headers
+        
+        clock.value += 3600
+        assert oauth2_auth.get_cached_headers() is None
+        assert token_route.call_count == 1
+
+
+class TestOAuth2SingleFlightRefresh:
+    """Test cases for sharing one token refresh between concurrent callers."""
+    
+    async def test_concurrent_callers_share_refresh(self, oauth2_auth, token_route):
+        """Test concurrent requests without a token make one token request."""
+        token_route.side_effect = _slow_token_endpoint("shared")
+        
+        results = await asyncio.gather(*(oauth2_auth.get_headers() for _ in range(5)))
+        
+        assert token_route.call_count == 1
+        assert all(headers is results[0] for headers in results)
+        assert results[0] == {"Authorization": "Bearer shared"}
+    
+    async def test_expired_token_refreshed_once(self, oauth2_auth, token_route, clock):
+        """Test concurrent callers holding an expired token refresh it once."""
+        token_route.side_effect = _slow_token_endpoint("first", "second")
+        await oauth2_auth.get_headers()
+        clock.value += 3600
+        
+        results = await asyncio.gather(*(oauth2_auth.get_headers() for _ in range(5)))
+        
+        assert token_route.call_count == 2
+        assert {headers["Authorization"] for headers in results} == {"Bearer second"}
+    
+    async def test_valid_token_skips_lock(self, oauth2_auth, token_route):
+        """Test a valid token is used without requesting a new one."""
+        token_route.side_effect = _slow_token_endpoint("first")
+        await oauth2_auth.get_headers()
+        
+        await asyncio.gather(*(oauth2_auth.refresh_if_needed() for _ in range(3)))
+        
+        assert token_route.call_count == 1
@@ -1,23 +1,53 @@
 """Tests for HTTP client module."""
 
-import pytest
 import asyncio
-from unittest.mock import Mock, patch, AsyncMock
-from typing import Dict, Any
+import threading
+import time
+import pytest
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any
+from uuid import UUID
 
 import httpx
 from pydantic import BaseModel
 
-from dataapi.client import HTTPClient
+from dataapi.auth import APIKeyAuth
+from dataapi.client import HTTPClient, _dumps, _loads
 from dataapi.config import ClientConfig
-from dataapi.auth import APIKeyAuth, BearerTokenAuth
 from dataapi.exceptions import (
     AuthenticationError,
     NotFoundError,
     RateLimitError,
     ServerError,
-    NetworkError
+    NetworkError,
+    ValidationError
 )
+from dataapi.types import SortField, SortOrder
+
+
+pytestmark = pytest.mark.xdist_group("http_client")
+
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+
+def _resp(status_code: int, payload: Any) -> SimpleNamespace:
+    """Build a minimal stand-in for an httpx response.
+    
+    Carries the attributes HTTPClient._handle_response reads (``is_success``,
+    ``headers``, ``content``, ``text``) plus ``json()`` for error mapping.
+    """
+    content = _dumps(payload)
+    return SimpleNamespace(
+        status_code=status_code,
+        is_success=200 <= status_code < 300,
+        headers=_JSON_HEADERS,
+        content=content,
+        text=content.decode(),
+        json=lambda: payload,
+    )
 
 
 class TestModel(BaseModel):
@@ -27,461 +57,499 @@ class TestModel(BaseModel):
     value: int
 
 
+_PAYLOAD_OK = {"id": "123", "name": "test", "value": 42}
+_EXPECTED_MODEL = TestModel.model_construct(**_PAYLOAD_OK)
+
+
+@pytest.fixture
+async def stream_transport(aclient, monkeypatch):
+    """Route aclient's async requests through an httpx mock transport.
+    
+    Tests set ``handler`` on the returned namespace to produce responses;
+    received requests are collected in ``requests``.
+    """
+    state = SimpleNamespace(handler=None, requests=[])
+    
+    def dispatch(request):
+        state.requests.append(request)
+        return state.handler(request)
+    
+    transport_client = httpx.AsyncClient(transport=httpx.MockTransport(dispatch))
+    
+    async def get_async_client():
+        return transport_client
+    
+    monkeypatch.setattr(aclient, "_get_async_client", get_async_client)
+    yield state
+    await transport_client.aclose()
+
+
 class TestHTTPClient:
     """Test cases for HTTPClient class."""
     
-    def test_client_creation(self):
+    def test_client_creation(self, config, api_key_auth):
         """Test HTTP client creation."""
-        config = ClientConfig()
-        auth = APIKeyAuth(api_key="test-key")
-        client = HTTPClient(config=config, auth=auth)
+        client = HTTPClient(config=config, auth=api_key_auth)
         
         assert client.config == config
-        assert client.auth == auth
-        assert client._async_client is None
+        assert client.auth == api_key_auth
+        assert client._client is None
         assert client._sync_client is None
     
-    def test_client_creation_without_auth(self):
+    def test_client_creation_with_json_hooks(self, config, api_key_auth):
+        """Test HTTP client creation with custom JSON hooks."""
+        def serializer(obj):
+            return b"{}"
+        
+        def deserializer(content):
+            return {}
+        
+        client = HTTPClient(
+            config=config,
+            auth=api_key_auth,
+            json_serializer=serializer,
+            json_deserializer=deserializer,
+        )
+        
+        assert client._dumps is serializer
+        assert client._loads is deserializer
+    
+    def test_default_json_hooks(self):
+        """Test default JSON hooks round-trip non-native types."""
+        payload = {
+            "id": UUID("12345678-1234-5678-1234-567812345678"),
+            "amount": Decimal("1.50"),
+            "created_at": datetime(2024, 1, 1, 12, 0, 0),
+        }
+        
+        assert _loads(_dumps(payload)) == {
+            "id": "12345678-1234-5678-1234-567812345678",
+            "amount": "1.50",
+            "created_at": "2024-01-01T12:00:00",
+        }
+    
+    def test_default_json_hooks_models(self):
+        """Test default serializer encodes models and nested models."""
+        sort_field = SortField(field="created_at", order=SortOrder.DESC)
+        
+        assert _loads(_dumps(sort_field)) == {"field": "created_at", "order": "desc"}
+        assert _loads(_dumps({"sort": [sort_field]})) == {
+            "sort": [{"field": "created_at", "order": "desc"}]
+        }
+    
+    def test_default_json_hooks_non_str_keys(self):
+        """Test int and enum dict keys are coerced to strings like stdlib json."""
+        payload = {1: "one", SortOrder.DESC: {2.5: True}}
+        
+        assert _loads(_dumps(payload)) == {"1": "one", "desc": {"2.5": True}}
+    
+    def test_client_creation_without_auth(self, config):
         """Test HTTP client creation without authentication."""
-        config = ClientConfig()
         client = HTTPClient(config=config)
         
         assert client.config == config
         assert client.auth is None
     
-    @pytest.mark.asyncio
-    async def test_async_client_initialization(self):
+    async def test_async_client_initialization(self, aclient):
         """Test async client initialization."""
-        config = ClientConfig()
-        auth = APIKeyAuth(api_key="test-key")
-        client = HTTPClient(config=config, auth=auth)
-        
         # Access async client to trigger initialization
-        async_client = client._get_async_client()
+        async_client = await aclient._get_async_client()
         assert async_client is not None
         assert isinstance(async_client, httpx.AsyncClient)
-        
-        # Cleanup
-        await client.close_async()
     
-    def test_sync_client_initialization(self):
+    def test_sync_client_initialization(self, shared_sync_client):
         """Test sync client initialization."""
-        config = ClientConfig()
-        auth = APIKeyAuth(api_key="test-key")
-        client = HTTPClient(config=config, auth=auth)
-        
         # Access sync client to trigger initialization
-        sync_client = client._get_sync_client()
+        sync_client = shared_sync_client._get_sync_client()
         assert sync_client is not None
         assert isinstance(sync_client, httpx.Client)
+    
+    def test_run_sync(self, client):
+        """Test running a coroutine from sync code."""
+        async def answer():
+            return 42
+        
+        assert client.run_sync(answer()) == 42
+        loop = client._loop
+        assert client.run_sync(answer()) == 42
+        assert client._loop is loop
         
-        # Cleanup
         client.close()
+        assert client._loop is None
     
-    @pytest.mark.asyncio
-    async def test_async_get_request(self):
-        """Test async GET request."""
-        config = ClientConfig()
-        auth = APIKeyAuth(api_key="test-key")
-        client = HTTPClient(config=config, auth=auth)
+    async def test_run_sync_inside_event_loop(self, client):
+        """Test run_sync also works while the caller's event loop is running."""
+        async def answer():
+            return 42
         
-        # Mock response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"id": "123", "name": "test", "value": 42}
-        
-        with patch.object(client, '_get_async_client') as mock_get_client:
-            mock_async_client = AsyncMock()
-            mock_async_client.get.return_value = mock_response
-            mock_get_client.return_value = mock_async_client
-            
-            response = await client.request_async(
-                method="GET",
-                endpoint="/test",
-                response_model=TestModel
-            )
-            
-            assert isinstance(response, TestModel)
-            assert response.id == "123"
-            assert response.name == "test"
-            assert response.value == 42
-            
-            # Verify the request was made correctly
-            mock_async_client.get.assert_called_once()
-            call_args = mock_async_client.get.call_args
-            assert "/test" in call_args[0][0]  # URL contains endpoint
+        assert client.run_sync(answer()) == 42
+    
+    async def test_async_client_per_event_loop(self, client):
+        """Test run_sync and the caller's loop never share an async client."""
+        caller_client = await client._get_async_client()
+        loop_client = client.run_sync(client._get_async_client())
+        
+        assert loop_client is not caller_client
+        assert client.run_sync(client._get_async_client()) is loop_client
+        assert await client._get_async_client() is caller_client
         
         await client.close_async()
+        assert client._client is None
+        assert client._loop_client is None
+        assert client._loop is None
     
-    def test_sync_get_request(self):
-        """Test sync GET request."""
-        config = ClientConfig()
-        auth = APIKeyAuth(api_key="test-key")
-        client = HTTPClient(config=config, auth=auth)
+    async def test_close_async_does_not_block_event_loop(self, client):
+        """Test close_async keeps the caller's loop running during teardown."""
+        loop = client._get_loop()
+        busy = threading.Event()
         
-        # Mock response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"id": "123", "name": "test", "value": 42}
-        
-        with patch.object(client, '_get_sync_client') as mock_get_client:
-            mock_sync_client = Mock()
-            mock_sync_client.get.return_value = mock_response
-            mock_get_client.return_value = mock_sync_client
-            
-            response = client.request(
-                method="GET",
-                endpoint="/test",
-                response_model=TestModel
-            )
-            
-            assert isinstance(response, TestModel)
-            assert response.id == "123"
-            assert response.name == "test"
-            assert response.value == 42
-            
-            # Verify the request was made correctly
-            mock_sync_client.get.assert_called_once()
+        async def block_background_loop():
+            busy.set()
+            time.sleep(0.2)
         
-        client.close()
-    
-    @pytest.mark.asyncio
-    async def test_async_post_request_with_data(self):
-        """Test async POST request with data."""
-        config = ClientConfig()
-        auth = BearerTokenAuth(token="test-token")
-        client = HTTPClient(config=config, auth=auth)
+        asyncio.run_coroutine_threadsafe(block_background_loop(), loop)
+        busy.wait()
         
-        # Mock response
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = {"id": "456", "name": "created", "value": 100}
-        
-        with patch.object(client, '_get_async_client') as mock_get_client:
-            mock_async_client = AsyncMock()
-            mock_async_client.post.return_value = mock_response
-            mock_get_client.return_value = mock_async_client
-            
-            request_data = {"name": "new_item", "value": 100}
-            response = await client.request_async(
-                method="POST",
-                endpoint="/items",
-                data=request_data,
-                response_model=TestModel
-            )
-            
-            assert isinstance(response, TestModel)
-            assert response.id == "456"
-            assert response.name == "created"
-            
-            # Verify the request was made with correct data
-            mock_async_client.post.assert_called_once()
-            call_kwargs = mock_async_client.post.call_args[1]
-            assert "json" in call_kwargs
-            assert call_kwargs["json"] == request_data
+        ticks = 0
+        
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
         
+        ticker = asyncio.ensure_future(tick())
         await client.close_async()
+        ticker.cancel()
+        
+        assert ticks > 1
+        assert client._loop is None
+        assert loop.is_closed()
     
-    @pytest.mark.asyncio
-    async def test_async_request_with_params(self):
-        """Test async request with query parameters."""
-        config = ClientConfig()
-        auth = APIKeyAuth(api_key="test-key")
-        client = HTTPClient(config=config, auth=auth)
+    def test_close_async_on_background_loop(self, client):
+        """Test close_async run through run_sync shuts the loop down cleanly."""
+        client.run_sync(client._get_async_client())
+        thread = client._loop_thread
         
-        # Mock response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = [{"id": "1", "name": "item1", "value": 10}]
-        
-        with patch.object(client, '_get_async_client') as mock_get_client:
-            mock_async_client = AsyncMock()
-            mock_async_client.get.return_value = mock_response
-            mock_get_client.return_value = mock_async_client
-            
-            params = {"page": 1, "per_page": 10, "filter": "active"}
-            response = await client.request_async(
-                method="GET",
-                endpoint="/items",
-                params=params
-            )
-            
-            assert response == [{"id": "1", "name": "item1", "value": 10}]
-            
-            # Verify the request was made with correct params
-            mock_async_client.get.assert_called_once()
-            call_kwargs = mock_async_client.get.call_args[1]
-            assert "params" in call_kwargs
-            assert call_kwargs["params"] == params
+        client.run_sync(client.close_async())
+        thread.join(timeout=5)
         
-        await client.close_async()
+        assert not thread.is_alive()
+        assert client._loop is None
+        assert client._loop_client is None
     
-    @pytest.mark.asyncio
-    async def test_async_request_authentication_error(self):
-        """Test async request with authentication error."""
-        config = ClientConfig()
-        auth = APIKeyAuth(api_key="invalid-key")
-        client = HTTPClient(config=config, auth=auth)
-        
-        # Mock 401 response
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_response.json.return_value = {"error": "Invalid API key"}
-        
-        with patch.object(client, '_get_async_client') as mock_get_client:
-            mock_async_client = AsyncMock()
-            mock_async_client.get.return_value = mock_response
-            mock_get_client.return_value = mock_async_client
-            
-            with pytest.raises(AuthenticationError, match="Invalid API key"):
-                await client.request_async(
-                    method="GET",
-                    endpoint="/protected"
-                )
+    def test_close_on_background_loop_raises(self, client):
+        """Test the blocking close() refuses to run on the loop it would join."""
+        async def close_from_loop():
+            client.close()
         
-        await client.close_async()
+        with pytest.raises(RuntimeError, match="use close_async"):
+            client.run_sync(close_from_loop())
     
-    @pytest.mark.asyncio
-    async def test_async_request_not_found_error(self):
-        """Test async request with not found error."""
-        config = ClientConfig()
-        auth = APIKeyAuth(api_key="test-key")
-        client = HTTPClient(config=config, auth=auth)
-        
-        # Mock 404 response
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_response.json.return_value = {"error": "Resource not found"}
-        
-        with patch.object(client, '_get_async_client') as mock_get_client:
-            mock_async_client = AsyncMock()
-            mock_async_client.get.return_value = mock_response
-            mock_get_client.return_value = mock_async_client
-            
-            with pytest.raises(NotFoundError, match="Resource not found"):
-                await client.request_async(
-                    method="GET",
-                    endpoint="/nonexistent"
-                )
+    async def test_async_get_request(self, aclient, mock_async_http):
+        """Test async GET request."""
+        # Mock response
+        mock_response = _resp(200, _PAYLOAD_OK)
         
-        await client.close_async()
-    
-    @pytest.mark.asyncio
-    async def test_async_request_rate_limit_error(self):
-        """Test async request with rate limit error."""
-        config = ClientConfig()
-        auth = APIKeyAuth(api_key="test-key")
-        client = HTTPClient(config=config, auth=auth)
-        
-        # Mock 429 response
-        mock_response = Mock()
-        mock_response.status_code = 429
-        mock_response.json.return_value = {"error": "Rate limit exceeded"}
-        
-        with patch.object(client, '_get_async_client') as mock_get_client:
-            mock_async_client = AsyncMock()
-            mock_async_client.get.return_value = mock_response
-            mock_get_client.return_value = mock_async_client
-            
-            with pytest.raises(RateLimitError, match="Rate limit exceeded"):
-                await client.request_async(
-                    method="GET",
-                    endpoint="/api/data"
-                )
+        mock_async_http.request.return_value = mock_response
         
-        await client.close_async()
+        response = await aclient.get_async("/test", response_model=TestModel)
+        
+        assert response == _EXPECTED_MODEL
+        
+        # Verify the request was made correctly
+        mock_async_http.request.assert_called_once()
+        call_kwargs = mock_async_http.request.call_args[1]
+        assert call_kwargs["method"] == "GET"
+        assert call_kwargs["url"].endswith("/test")
     
-    @pytest.mark.asyncio
-    async def test_async_request_server_error(self):
-        """Test async request with server error."""
-        config = ClientConfig()
-        auth = APIKeyAuth(api_key="test-key")
-        client = HTTPClient(config=config, auth=auth)
-        
-        # Mock 500 response
-        mock_response = Mock()
-        mock_response.status_code = 500
-        mock_response.json.return_value = {"error": "Internal server error"}
-        
-        with patch.object(client, '_get_async_client') as mock_get_client:
-            mock_async_client = AsyncMock()
-            mock_async_client.get.return_value = mock_response
-            mock_get_client.return_value = mock_async_client
-            
-            with pytest.raises(ServerError, match="Internal server error"):
-                await client.request_async(
-                    method="GET",
-                    endpoint="/api/data"
-                )
+    def test_sync_get_request(self, shared_sync_client, mock_sync_http):
+        """Test sync GET request."""
+        # Mock response
+        mock_response = _resp(200, _PAYLOAD_OK)
         
-        await client.close_async()
+        mock_sync_http.request.return_value = mock_response
+        
+        response = shared_sync_client.get("/test", response_model=TestModel)
+        
+        assert response == _EXPECTED_MODEL
+        
+        # Verify the request was made correctly
+        mock_sync_http.request.assert_called_once()
+        assert mock_sync_http.request.call_args[1]["method"] == "GET"
     
-    @pytest.mark.asyncio
-    async def test_async_request_network_error(self):
-        """Test async request with network error."""
-        config = ClientConfig()
-        auth = APIKeyAuth(api_key="test-key")
-        client = HTTPClient(config=config, auth=auth)
-        
-        with patch.object(client, '_get_async_client') as mock_get_client:
-            mock_async_client = AsyncMock()
-            mock_async_client.get.side_effect = httpx.ConnectError("Connection failed")
-            mock_get_client.return_value = mock_async_client
-            
-            with pytest.raises(NetworkError, match="Connection failed"):
-                await client.request_async(
-                    method="GET",
-                    endpoint="/api/data"
-                )
+    async def test_async_post_request_with_data(
+        self, aclient, mock_async_http, bearer_auth, monkeypatch
+    ):
+        """Test async POST request with data."""
+        monkeypatch.setattr(aclient, "auth", bearer_auth)
         
-        await client.close_async()
+        # Mock response
+        mock_response = _resp(201, {"id": "456", "name": "created", "value": 100})
+        
+        mock_async_http.request.return_value = mock_response
+        
+        request_data = {"name": "new_item", "value": 100}
+        response = await aclient.post_async(
+            "/items",
+            json_data=request_data,
+            response_model=TestModel
+        )
+        
+        assert isinstance(response, TestModel)
+        assert response.id == "456"
+        assert response.name == "created"
+        
+        # Verify the request was made with correct data
+        mock_async_http.request.assert_called_once()
+        call_kwargs = mock_async_http.request.call_args[1]
+        assert call_kwargs["method"] == "POST"
+        assert _loads(call_kwargs["content"]) == request_data
+        assert call_kwargs["headers"]["Authorization"] == "Bearer test-token"
     
-    @pytest.mark.asyncio
-    async def test_async_request_timeout_error(self):
-        """Test async request with timeout error."""
-        config = ClientConfig()
-        auth = APIKeyAuth(api_key="test-key")
-        client = HTTPClient(config=config, auth=auth)
-        
-        with patch.object(client, '_get_async_client') as mock_get_client:
-            mock_async_client = AsyncMock()
-            mock_async_client.get.side_effect = httpx.TimeoutException("Request timeout")
-            mock_get_client.return_value = mock_async_client
-            
-            with pytest.raises(NetworkError, match="Request timeout"):
-                await client.request_async(
-                    method="GET",
-                    endpoint="/api/data"
-                )
+    async def test_async_request_with_params(self, aclient, mock_async_http):
+        """Test async request with query parameters."""
+        # Mock response
+        mock_response = _resp(200, [{"id": "1", "name": "item1", "value": 10}])
         
-        await client.close_async()
+        mock_async_http.request.return_value = mock_response
+        
+        params = {"page": 1, "per_page": 10, "filter": "active"}
+        response = await aclient.get_async("/items", params=params)
+        
+        assert response == [{"id": "1", "name": "item1", "value": 10}]
+        
+        # Verify the request was made with correct params
+        mock_async_http.request.assert_called_once()
+        call_kwargs = mock_async_http.request.call_args[1]
+        assert call_kwargs["params"] == params
+    
+    @pytest.mark.parametrize("status_code,body,expected_error,match", [
+        (401, {"message": "Invalid API key"}, AuthenticationError, "Invalid API key"),
+        (404, {"message": "Resource not found"}, NotFoundError, "Resource not found"),
+        (429, {"message": "Rate limit exceeded"}, RateLimitError, "Rate limit exceeded"),
+        (500, {"message": "Internal server error"}, ServerError, "Internal server error"),
+    ])
+    async def test_async_request_error_mapping(
+        self, aclient, mock_async_http, monkeypatch, no_sleep,
+        status_code, body, expected_error, match
+    ):
+        """Test async request maps error status codes to exceptions."""
+        monkeypatch.setattr(aclient, "config", ClientConfig(max_retries=0))
+        mock_response = _resp(status_code, body)
+        
+        mock_async_http.request.return_value = mock_response
+        
+        with pytest.raises(expected_error, match=match) as exc_info:
+            await aclient.get_async("/api/data")
+        
+        assert exc_info.value.status_code == status_code
+    
+    @pytest.mark.parametrize("error,match", [
+        (httpx.ConnectError("Connection failed"), "Connection failed"),
+        (httpx.TimeoutException("Request timeout"), "Request timeout"),
+    ])
+    async def test_async_request_network_error_mapping(
+        self, aclient, mock_async_http, monkeypatch, error, match
+    ):
+        """Test async request maps transport errors to NetworkError."""
+        monkeypatch.setattr(aclient, "config", ClientConfig(max_retries=0))
+        mock_async_http.request.side_effect = error
+        
+        with pytest.raises(NetworkError, match=match):
+            await aclient.get_async("/api/data")
     
-    @pytest.mark.asyncio
-    async def test_async_request_retry_on_timeout(self):
+    async def test_async_request_retry_on_timeout(
+        self, aclient, mock_async_http, monkeypatch, no_sleep
+    ):
         """Test async request retry on timeout."""
-        config = ClientConfig(max_retries=2, retry_delay=0.1)
-        auth = APIKeyAuth(api_key="test-key")
-        client = HTTPClient(config=config, auth=auth)
+        monkeypatch.setattr(aclient, "config", ClientConfig(max_retries=2, retry_delay=0.1))
         
         # Mock successful response after retries
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"id": "123", "name": "test", "value": 42}
-        
-        with patch.object(client, '_get_async_client') as mock_get_client:
-            mock_async_client = AsyncMock()
-            # First two calls timeout, third succeeds
-            mock_async_client.get.side_effect = [
-                httpx.TimeoutException("Timeout 1"),
-                httpx.TimeoutException("Timeout 2"),
-                mock_response
-            ]
-            mock_get_client.return_value = mock_async_client
-            
-            response = await client.request_async(
-                method="GET",
-                endpoint="/test",
-                response_model=TestModel
-            )
-            
-            assert isinstance(response, TestModel)
-            assert response.id == "123"
-            
-            # Verify 3 attempts were made (initial + 2 retries)
-            assert mock_async_client.get.call_count == 3
+        mock_response = _resp(200, _PAYLOAD_OK)
         
-        await client.close_async()
+        # First two calls timeout, third succeeds
+        mock_async_http.request.side_effect = [
+            httpx.TimeoutException("Timeout 1"),
+            httpx.TimeoutException("Timeout 2"),
+            mock_response
+        ]
+        
+        response = await aclient.get_async("/test", response_model=TestModel)
+        
+        assert response == _EXPECTED_MODEL
+        
+        # Verify 3 attempts were made (initial + 2 retries)
+        assert mock_async_http.request.call_count == 3
     
-    @pytest.mark.asyncio
-    async def test_async_request_max_retries_exceeded(self):
+    async def test_async_request_max_retries_exceeded(
+        self, aclient, mock_async_http, monkeypatch, no_sleep
+    ):
         """Test async request when max retries exceeded."""
-        config = ClientConfig(max_retries=1, retry_delay=0.1)
-        auth = APIKeyAuth(api_key="test-key")
-        client = HTTPClient(config=config, auth=auth)
-        
-        with patch.object(client, '_get_async_client') as mock_get_client:
-            mock_async_client = AsyncMock()
-            # All calls timeout
-            mock_async_client.get.side_effect = httpx.TimeoutException("Persistent timeout")
-            mock_get_client.return_value = mock_async_client
-            
-            with pytest.raises(NetworkError, match="Persistent timeout"):
-                await client.request_async(
-                    method="GET",
-                    endpoint="/test"
-                )
-            
-            # Verify 2 attempts were made (initial + 1 retry)
-            assert mock_async_client.get.call_count == 2
+        monkeypatch.setattr(aclient, "config", ClientConfig(max_retries=1, retry_delay=0.1))
         
-        await client.close_async()
+        # All calls timeout
+        mock_async_http.request.side_effect = httpx.TimeoutException("Persistent timeout")
+        
+        with pytest.raises(NetworkError, match="Persistent timeout"):
+            await aclient.get_async("/test")
+        
+        # Verify 2 attempts were made (initial + 1 retry)
+        assert mock_async_http.request.call_count == 2
     
-    def test_auth_headers_included(self):
+    def test_auth_headers_included(self, shared_sync_client, mock_sync_http):
         """Test that authentication headers are included in requests."""
-        config = ClientConfig()
-        auth = APIKeyAuth(api_key="test-key")
-        client = HTTPClient(config=config, auth=auth)
-        
         # Mock response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"success": True}
-        
-        with patch.object(client, '_get_sync_client') as mock_get_client:
-            mock_sync_client = Mock()
-            mock_sync_client.get.return_value = mock_response
-            mock_get_client.return_value = mock_sync_client
-            
-            client.request(method="GET", endpoint="/test")
-            
-            # Verify headers include authentication
-            call_kwargs = mock_sync_client.get.call_args[1]
-            assert "headers" in call_kwargs
-            headers = call_kwargs["headers"]
-            assert "X-API-Key" in headers
-            assert headers["X-API-Key"] == "test-key"
+        mock_response = _resp(200, {"success": True})
         
-        client.close()
+        mock_sync_http.request.return_value = mock_response
+        
+        shared_sync_client.get("/test")
+        
+        # Verify headers include authentication
+        headers = mock_sync_http.request.call_args[1]["headers"]
+        assert headers["X-API-Key"] == "test-key"
+        assert headers["User-Agent"] == shared_sync_client.config.user_agent
     
-    @pytest.mark.asyncio
-    async def test_context_manager_async(self):
-        """Test async context manager usage."""
-        config = ClientConfig()
-        auth = APIKeyAuth(api_key="test-key")
+    def test_sync_request_skips_event_loop(
+        self, shared_sync_client, mock_sync_http, monkeypatch
+    ):
+        """Test sync requests read cached auth headers without run_sync."""
+        def fail_run_sync(coro):
+            coro.close()
+            raise AssertionError("run_sync should not be used for cached headers")
+        
+        monkeypatch.setattr(shared_sync_client, "run_sync", fail_run_sync)
+        mock_sync_http.request.return_value = _resp(200, {"success": True})
+        
+        shared_sync_client.get("/test")
         
-        async with HTTPClient(config=config, auth=auth) as client:
-            assert client is not None
-            # Client should be usable within context
-            assert client.config == config
+        assert mock_sync_http.request.call_args[1]["headers"]["X-API-Key"] == "test-key"
     
-    def test_context_manager_sync(self):
-        """Test sync context manager usage."""
-        config = ClientConfig()
-        auth = APIKeyAuth(api_key="test-key")
+    def test_sync_request_fetches_uncached_headers(
+        self, shared_sync_client, mock_sync_http, monkeypatch
+    ):
+        """Test sync requests await the provider when no headers are cached."""
+        class FetchingAuth(APIKeyAuth):
+            def get_cached_headers(self):
+                return None
         
-        with HTTPClient(config=config, auth=auth) as client:
-            assert client is not None
-            # Client should be usable within context
-            assert client.config == config
+        monkeypatch.setattr(shared_sync_client, "auth", FetchingAuth(api_key="fetched"))
+        mock_sync_http.request.return_value = _resp(200, {"success": True})
+        
+        shared_sync_client.get("/test")
+        
+        assert mock_sync_http.request.call_args[1]["headers"]["X-API-Key"] == "fetched"
     
-    def test_request_without_response_model(self):
+    @pytest.mark.parametrize("mode", ["sync", "async"])
+    async def test_context_manager(self, mode, config, api_key_auth):
+        """Test sync and async context manager usage."""
+        if mode == "async":
+            async with HTTPClient(config=config, auth=api_key_auth) as client:
+                # Client should be usable within context
+                assert client.config is config
+        else:
+            with HTTPClient(config=config, auth=api_key_auth) as client:
+                # Client should be usable within context
+                assert client.config is config
+    
+    def test_request_without_response_model(self, shared_sync_client, mock_sync_http):
         """Test request without response model returns raw JSON."""
-        config = ClientConfig()
-        auth = APIKeyAuth(api_key="test-key")
-        client = HTTPClient(config=config, auth=auth)
-        
         # Mock response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"raw": "data", "count": 5}
-        
-        with patch.object(client, '_get_sync_client') as mock_get_client:
-            mock_sync_client = Mock()
-            mock_sync_client.get.return_value = mock_response
-            mock_get_client.return_value = mock_sync_client
-            
-            response = client.request(method="GET", endpoint="/raw")
-            
-            assert response == {"raw": "data", "count": 5}
-        
-        client.close()
\ No newline at end of file
+        mock_response = _resp(200, {"raw": "data", "count": 5})
+        
+        mock_sync_http.request.return_value = mock_response
+        
+        response = shared_sync_client.get("/raw")
+        
+        assert response == {"raw": "data", "count": 5}
+    
+    async def test_raw_response_skips_content_type_check(
+        self, aclient, mock_async_http
+    ):
+        """Test raw_response decodes the body whatever its content type."""
+        mock_response = _resp(200, {"valid": True})
+        mock_response.headers = {"content-type": "text/plain"}
+        
+        mock_async_http.request.return_value = mock_response
+        
+        response = await aclient.post_async(
+            "/validate", response_model=TestModel, raw_response=True
+        )
+        
+        assert response == {"valid": True}
+    
+    async def test_raw_response_empty_body(self, aclient, mock_async_http):
+        """Test raw_response returns None for an empty body."""
+        mock_response = _resp(200, None)
+        mock_response.content = b""
+        
+        mock_async_http.request.return_value = mock_response
+        
+        assert await aclient.get_async("/empty", raw_response=True) is None
+    
+    async def test_construct_only_skips_validation(self, aclient, mock_async_http):
+        """Test construct_only builds the model without running validators."""
+        payload = {"id": "123", "name": "test", "value": "not-a-number"}
+        mock_async_http.request.return_value = _resp(200, payload)
+        
+        response = await aclient.get_async(
+            "/test", response_model=TestModel, construct_only=True
+        )
+        
+        assert isinstance(response, TestModel)
+        assert response.value == "not-a-number"
+        
+        with pytest.raises(ValidationError, match="Response validation failed"):
+            await aclient.get_async("/test", response_model=TestModel)
+    
+    async def test_construct_only_list(self, aclient, mock_async_http):
+        """Test construct_only builds each item of a list response."""
+        mock_async_http.request.return_value = _resp(200, [_PAYLOAD_OK, _PAYLOAD_OK])
+        
+        response = await aclient.post_async(
+            "/items", response_model=TestModel, construct_only=True
+        )
+        
+        assert response == [_EXPECTED_MODEL, _EXPECTED_MODEL]
+    
+    async def test_stream_json_lines(self, aclient, stream_transport):
+        """Test each non-empty line of the body is decoded and yielded."""
+        stream_transport.handler = lambda request: httpx.Response(
+            200, content=b'{"seq": 1}\n\n{"seq": 2}\n'
+        )
+        
+        entries = [
+            entry async for entry in aclient.stream_json_lines_async(
+                "/logs", params={"step_id": "extract"}
+            )
+        ]
+        
+        assert entries == [{"seq": 1}, {"seq": 2}]
+        request = stream_transport.requests[0]
+        assert request.url.params["step_id"] == "extract"
+        assert request.headers["Accept"] == "application/x-ndjson"
+        assert request.headers["X-API-Key"] == "test-key"
+    
+    async def test_stream_json_lines_error(self, aclient, stream_transport):
+        """Test an error status is mapped before any line is yielded."""
+        stream_transport.handler = lambda request: httpx.Response(
+            404, json={"message": "Execution not found"}
+        )
+        
+        with pytest.raises(NotFoundError, match="Execution not found"):
+            async for _ in aclient.stream_json_lines_async("/logs"):
+                pass
+    
+    async def test_stream_json_lines_network_error(self, aclient, stream_transport):
+        """Test transport errors are mapped to NetworkError and not retried."""
+        def fail(request):
+            raise httpx.ConnectError("Connection failed")
+        
+        stream_transport.handler = fail
+        
+        with pytest.raises(NetworkError, match="Connection failed"):
+            async for _ in aclient.stream_json_lines_async("/logs"):
+                pass
+        
+        assert len(stream_transport.requests) == 1
@@ -1,15 +1,26 @@
 """Tests for configuration module."""
 
 import pytest
+from pydantic import ValidationError
+
 from dataapi.config import ClientConfig
 
 
+pytestmark = pytest.mark.xdist_group("http_client")
+
+
+@pytest.fixture(scope="module")
+def default_config():
+    """Default configuration shared by tests that only read it."""
+    return ClientConfig()
+
+
 class TestClientConfig:
     """Test cases for ClientConfig class."""
     
-    def test_default_config(self):
+    def test_default_config(self, default_config):
         """Test default configuration values."""
-        config = ClientConfig()
+        config = default_config
         
         assert config.base_url == "https://api.dataapi.com"
         assert config.timeout == 30.0
@@ -17,6 +28,9 @@ class TestClientConfig:
         assert config.retry_delay == 1.0
         assert config.user_agent.startswith("DataAPI-Python-SDK/")
         assert config.verify_ssl is True
+        assert config.max_connections == 100
+        assert config.max_keepalive_connections == 20
+        assert config.http2 is True
     
     def test_custom_config(self):
         """Test custom configuration values."""
@@ -29,7 +43,7 @@ class TestClientConfig:
             verify_ssl=False
         )
         
-        assert config.base_url == "https://custom.api.com"
+        assert str(config.base_url) == "https://custom.api.com/"
         assert config.timeout == 60.0
         assert config.max_retries == 5
         assert config.retry_delay == 2.0
@@ -39,7 +53,7 @@ class TestClientConfig:
     def test_get_headers(self):
         """Test header generation."""
         config = ClientConfig(user_agent="Test-Agent/1.0")
-        headers = config.get_headers()
+        headers = config.model_dump_headers()
         
         assert "User-Agent" in headers
         assert headers["User-Agent"] == "Test-Agent/1.0"
@@ -48,30 +62,23 @@ class TestClientConfig:
         assert "Content-Type" in headers
         assert headers["Content-Type"] == "application/json"
     
-    def test_config_validation(self):
+    @pytest.mark.parametrize("kwargs", [
+        {"timeout": -1.0},
+        {"max_retries": -1},
+        {"retry_delay": -1.0},
+        {"base_url": "not-a-url"},
+    ])
+    def test_config_validation(self, kwargs):
         """Test configuration validation."""
-        # Test negative timeout
-        with pytest.raises(ValueError):
-            ClientConfig(timeout=-1.0)
-        
-        # Test negative max_retries
-        with pytest.raises(ValueError):
-            ClientConfig(max_retries=-1)
-        
-        # Test negative retry_delay
-        with pytest.raises(ValueError):
-            ClientConfig(retry_delay=-1.0)
-        
-        # Test invalid base_url
         with pytest.raises(ValueError):
-            ClientConfig(base_url="not-a-url")
+            ClientConfig(**kwargs)
     
-    def test_config_immutability(self):
+    def test_config_immutability(self, default_config):
         """Test that config is immutable after creation."""
-        config = ClientConfig()
+        config = default_config
         
         # Should not be able to modify after creation
-        with pytest.raises(AttributeError):
+        with pytest.raises(ValidationError, match="Instance is frozen"):
             config.base_url = "https://new.url.com"
     
     def test_config_serialization(self):
@@ -83,13 +90,10 @@ class TestClientConfig:
         )
         
         # Test dict conversion
-        config_dict = config.model_dump()
-        assert config_dict["base_url"] == "https://test.api.com"
+        config_dict = config.model_dump(mode="json")
+        assert config_dict["base_url"] == "https://test.api.com/"
         assert config_dict["timeout"] == 45.0
         assert config_dict["max_retries"] == 2
         
         # Test recreation from dict
-        new_config = ClientConfig(**config_dict)
-        assert new_config.base_url == config.base_url
-        assert new_config.timeout == config.timeout
-        assert new_config.max_retries == config.max_retries
\ No newline at end of file
+        assert ClientConfig.model_validate(config_dict) == config
\ No newline at end of file
@@ -2,7 +2,10 @@
 
 import pytest
 from datetime import datetime
-from typing import Any, Dict, List
+from types import MappingProxyType
+from typing import Any, Dict
+
+from pydantic import ValidationError
 
 from dataapi.types import (
     BaseDataAPIModel,
@@ -26,10 +29,155 @@ from dataapi.types import (
     SortField,
     FilterOperator,
     Filter,
-    QueryOptions
+    QueryOptions,
+    construct_model,
+    validate_list
+)
+
+
+# Sample payloads shared by the model tests; read-only at the top level.
+_SAMPLES = MappingProxyType({
+    "database_metadata": {"project": "test", "environment": "dev"},
+    "record_data": {"id": 1, "name": "John Doe", "email": "john@example.com"},
+    "ai_capabilities": ["text_generation", "chat"],
+    "ai_metadata": {"temperature": 0.7, "max_tokens": 100},
+})
+
+_PaginatedDict = PaginatedResponse[Dict[str, Any]]
+_PAGE_ITEMS = ({"id": 1, "name": "Item 1"}, {"id": 2, "name": "Item 2"})
+
+_TS = "2024-01-01T00:00:00"
+_TS_PARSED = datetime(2024, 1, 1)
+_TIMESTAMPS = {"created_at": _TS, "updated_at": _TS}
+_TIMESTAMPS_PARSED = {"created_at": _TS_PARSED, "updated_at": _TS_PARSED}
+
+# (model class, raw payload, expected values for fields the model coerces)
+_CREATION_CASES = (
+    (
+        Database,
+        {
+            "id": "db-123",
+            "name": "test_database",
+            "description": "Test database",
+            "owner_id": "user-123",
+            **_TIMESTAMPS,
+        },
+        _TIMESTAMPS_PARSED,
+    ),
+    (
+        Table,
+        {
+            "id": "table-123",
+            "name": "users",
+            "database_id": "db-123",
+            "schema": [
+                {"name": "id", "type": "integer", "primary_key": True},
+                {"name": "name", "type": "string"},
+            ],
+            **_TIMESTAMPS,
+        },
+        {
+            "schema": [
+                ColumnDefinition(name="id", type=ColumnType.INTEGER, primary_key=True),
+                ColumnDefinition(name="name", type=ColumnType.STRING),
+            ],
+            **_TIMESTAMPS_PARSED,
+        },
+    ),
+    (
+        Record,
+        {
+            "id": "record-123",
+            "table_id": "table-123",
+            "data": _SAMPLES["record_data"],
+            "version": "2",
+            **_TIMESTAMPS,
+        },
+        {"version": 2, **_TIMESTAMPS_PARSED},
+    ),
+    (
+        User,
+        {
+            "id": "user-123",
+            "email": "john@example.com",
+            "name": "John Doe",
+            "role": "developer",
+            **_TIMESTAMPS,
+        },
+        _TIMESTAMPS_PARSED,
+    ),
+    (
+        AIModel,
+        {
+            "id": "model-123",
+            "name": "GPT-4",
+            "provider": "openai",
+            "description": "Advanced language model",
+            "capabilities": _SAMPLES["ai_capabilities"],
+            "max_tokens": "4096",
+        },
+        {"max_tokens": 4096},
+    ),
+    (
+        AIResponse,
+        {
+            "id": "response-123",
+            "model_id": "model-123",
+            "prompt": "Say something.",
+            "response": "This is a generated response.",
+            "tokens_used": 25,
+            "created_at": _TS,
+        },
+        {"created_at": _TS_PARSED},
+    ),
+)
+_CREATION_IDS = [case[0].__name__ for case in _CREATION_CASES]
+
+_ENUM_VALUES = (
+    (ColumnType.STRING, "string"),
+    (ColumnType.INTEGER, "integer"),
+    (ColumnType.FLOAT, "float"),
+    (ColumnType.BOOLEAN, "boolean"),
+    (ColumnType.DATETIME, "datetime"),
+    (ColumnType.JSON, "json"),
+    (ColumnType.TEXT, "text"),
+    (ColumnType.BINARY, "binary"),
+    (UserRole.ADMIN, "admin"),
+    (UserRole.DEVELOPER, "developer"),
+    (UserRole.VIEWER, "viewer"),
+    (AIProvider.OPENAI, "openai"),
+    (AIProvider.ANTHROPIC, "anthropic"),
+    (AIProvider.GOOGLE, "google"),
+    (AIProvider.AZURE, "azure"),
+    (AIProvider.HUGGINGFACE, "huggingface"),
+    (WorkflowStatus.PENDING, "pending"),
+    (WorkflowStatus.RUNNING, "running"),
+    (WorkflowStatus.COMPLETED, "completed"),
+    (WorkflowStatus.FAILED, "failed"),
+    (WorkflowStatus.CANCELLED, "cancelled"),
+    (SortOrder.ASC, "asc"),
+    (SortOrder.DESC, "desc"),
+    (FilterOperator.EQ, "eq"),
+    (FilterOperator.NE, "ne"),
+    (FilterOperator.GT, "gt"),
+    (FilterOperator.GTE, "gte"),
+    (FilterOperator.LT, "lt"),
+    (FilterOperator.LTE, "lte"),
+    (FilterOperator.IN, "in"),
+    (FilterOperator.NOT_IN, "not_in"),
+    (FilterOperator.LIKE, "like"),
+    (FilterOperator.ILIKE, "ilike"),
+    (FilterOperator.IS_NULL, "is_null"),
+    (FilterOperator.IS_NOT_NULL, "is_not_null"),
 )
 
 
+@pytest.fixture(scope="session")
+def sample_page_info():
+    """First page of 50 items at 10 per page, validated once per session."""
+    return PageInfo(page=1, per_page=10, total=50)
+
+
 class TestBaseDataAPIModel:
     """Test cases for BaseDataAPIModel class."""
     
@@ -45,50 +193,66 @@ class TestBaseDataAPIModel:
         assert isinstance(data, dict)
 
 
-class TestDatabase:
-    """Test cases for Database model."""
+class TestModelCreation:
+    """Test cases for validating models from raw payloads."""
     
-    def test_database_creation(self):
-        """Test database creation with required fields."""
-        db = Database(
-            id="db-123",
-            name="test_database",
-            description="Test database",
-            created_at=datetime.now(),
-            updated_at=datetime.now()
-        )
+    @pytest.mark.parametrize(
+        "model_cls,payload,coerced", _CREATION_CASES, ids=_CREATION_IDS
+    )
+    def test_model_creation(self, model_cls, payload, coerced):
+        """Test each payload value is validated and coerced onto the model."""
+        model = model_cls(**payload)
         
-        assert db.id == "db-123"
-        assert db.name == "test_database"
-        assert db.description == "Test database"
-        assert isinstance(db.created_at, datetime)
-        assert isinstance(db.updated_at, datetime)
+        for name, value in payload.items():
+            assert getattr(model, name) == coerced.get(name, value)
+        for name in coerced:
+            assert type(getattr(model, name)) is type(coerced[name])
+    
+    @pytest.mark.parametrize(
+        "model_cls,payload,coerced", _CREATION_CASES, ids=_CREATION_IDS
+    )
+    def test_model_required_fields(self, model_cls, payload, coerced):
+        """Test leaving out any required field fails validation."""
+        required = [
+            name for name, field in model_cls.model_fields.items() if field.is_required()
+        ]
+        assert required
+        
+        for name in required:
+            partial = {key: value for key, value in payload.items() if key != name}
+            with pytest.raises(ValidationError, match=name):
+                model_cls(**partial)
+
+
+class TestDatabase:
+    """Test cases for Database model."""
     
-    def test_database_with_metadata(self):
+    def test_database_with_metadata(self, frozen_now):
         """Test database creation with metadata."""
-        metadata = {"project": "test", "environment": "dev"}
-        db = Database(
+        metadata = _SAMPLES["database_metadata"]
+        db = Database.model_construct(
             id="db-123",
             name="test_database",
             description="Test database",
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=frozen_now,
+            updated_at=frozen_now,
             metadata=metadata
         )
         
         assert db.metadata == metadata
     
-    def test_database_optional_fields(self):
+    def test_database_optional_fields(self, frozen_now):
         """Test database with optional fields."""
         db = Database(
             id="db-123",
             name="test_database",
-            created_at=datetime.now(),
-            updated_at=datetime.now()
+            created_at=frozen_now,
+            updated_at=frozen_now,
+            owner_id="user-123"
         )
         
         assert db.description is None
-        assert db.metadata is None
+        assert db.metadata == {}
 
 
 class TestColumnDefinition:
@@ -114,14 +278,17 @@ class TestColumnDefinition:
             type=ColumnType.STRING,
             nullable=False,
             unique=True,
-            max_length=255
+            description="Login email address"
         )
         
         assert col.name == "email"
         assert col.type == ColumnType.STRING
         assert col.nullable is False
         assert col.unique is True
-        assert col.max_length == 255
+        assert col.description == "Login email address"
+        
+        with pytest.raises(ValidationError, match="max_length"):
+            ColumnDefinition(name="email", type=ColumnType.STRING, max_length=255)
     
     def test_column_definition_primary_key(self):
         """Test primary key column definition."""
@@ -139,90 +306,72 @@ class TestColumnDefinition:
 class TestTable:
     """Test cases for Table model."""
     
-    def test_table_creation(self):
-        """Test table creation."""
-        schema = [
-            ColumnDefinition(name="id", type=ColumnType.INTEGER, primary_key=True),
-            ColumnDefinition(name="name", type=ColumnType.STRING)
-        ]
-        
-        table = Table(
+    def test_table_with_description(self, frozen_now):
+        """Test table with description."""
+        table = Table.model_construct(
             id="table-123",
             name="users",
             database_id="db-123",
-            schema=schema,
-            created_at=datetime.now(),
-            updated_at=datetime.now()
+            schema=[],
+            description="User information table",
+            created_at=frozen_now,
+            updated_at=frozen_now
         )
         
-        assert table.id == "table-123"
-        assert table.name == "users"
-        assert table.database_id == "db-123"
-        assert len(table.schema) == 2
-        assert table.schema[0].name == "id"
-        assert table.schema[1].name == "name"
+        assert table.description == "User information table"
     
-    def test_table_with_description(self):
-        """Test table with description."""
+    def test_table_get_column(self, frozen_now):
+        """Test column lookup by name."""
         table = Table(
             id="table-123",
             name="users",
             database_id="db-123",
-            schema=[],
-            description="User information table",
-            created_at=datetime.now(),
-            updated_at=datetime.now()
+            schema=[ColumnDefinition(name="id", type=ColumnType.INTEGER, primary_key=True)],
+            created_at=frozen_now,
+            updated_at=frozen_now
         )
         
-        assert table.description == "User information table"
+        assert table.get_column("id").primary_key is True
+        assert table.get_column("missing") is None
+        
+        table.schema.append(ColumnDefinition(name="name", type=ColumnType.STRING))
+        assert table.get_column("name").type == ColumnType.STRING
+        
+        table.schema = [ColumnDefinition(name="email", type=ColumnType.STRING)]
+        assert table.get_column("id") is None
+        assert table.get_column("email").type == ColumnType.STRING
 
 
 class TestRecord:
     """Test cases for Record model."""
     
-    def test_record_creation(self):
-        """Test record creation."""
-        data = {"id": 1, "name": "John Doe", "email": "john@example.com"}
-        record = Record(
-            id="record-123",
-            table_id="table-123",
-            data=data,
-            created_at=datetime.now(),
-            updated_at=datetime.now()
-        )
+    def test_record_equality_by_id(self, frozen_now):
+        """Test records compare and hash by ID."""
+        def make_record(record_id: str, data: Dict[str, Any]) -> Record:
+            return Record(
+                id=record_id,
+                table_id="table-123",
+                data=data,
+                created_at=frozen_now,
+                updated_at=frozen_now
+            )
         
-        assert record.id == "record-123"
-        assert record.table_id == "table-123"
-        assert record.data == data
-        assert record.data["name"] == "John Doe"
+        assert make_record("record-1", {"v": 1}) == make_record("record-1", {"v": 2})
+        assert make_record("record-1", {}) != make_record("record-2", {})
+        assert len({make_record("record-1", {}), make_record("record-1", {})}) == 1
 
 
 class TestUser:
     """Test cases for User model."""
     
-    def test_user_creation(self):
-        """Test user creation."""
-        user = User(
-            id="user-123",
-            username="johndoe",
-            email="john@example.com",
-            role=UserRole.USER,
-            created_at=datetime.now()
-        )
-        
-        assert user.id == "user-123"
-        assert user.username == "johndoe"
-        assert user.email == "john@example.com"
-        assert user.role == UserRole.USER
-    
-    def test_user_admin_role(self):
+    def test_user_admin_role(self, frozen_now):
         """Test user with admin role."""
-        user = User(
+        user = User.model_construct(
             id="user-123",
             username="admin",
             email="admin@example.com",
             role=UserRole.ADMIN,
-            created_at=datetime.now()
+            created_at=frozen_now
         )
         
         assert user.role == UserRole.ADMIN
@@ -231,83 +380,37 @@ class TestUser:
 class TestAIModel:
     """Test cases for AIModel model."""
     
-    def test_ai_model_creation(self):
-        """Test AI model creation."""
-        model = AIModel(
-            id="model-123",
-            name="GPT-4",
-            provider=AIProvider.OPENAI,
-            description="Advanced language model",
-            capabilities=["text_generation", "chat"],
-            max_tokens=4096,
-            created_at=datetime.now()
-        )
-        
-        assert model.id == "model-123"
-        assert model.name == "GPT-4"
-        assert model.provider == AIProvider.OPENAI
-        assert "text_generation" in model.capabilities
-        assert model.max_tokens == 4096
-    
-    def test_ai_model_different_providers(self):
+    @pytest.mark.parametrize("provider", [
+        AIProvider.OPENAI,
+        AIProvider.ANTHROPIC,
+        AIProvider.GOOGLE,
+    ])
+    def test_ai_model_different_providers(self, frozen_now, provider):
         """Test AI models with different providers."""
-        models = [
-            AIModel(
-                id="model-1",
-                name="GPT-4",
-                provider=AIProvider.OPENAI,
-                capabilities=["text_generation"],
-                created_at=datetime.now()
-            ),
-            AIModel(
-                id="model-2",
-                name="Claude",
-                provider=AIProvider.ANTHROPIC,
-                capabilities=["text_generation"],
-                created_at=datetime.now()
-            ),
-            AIModel(
-                id="model-3",
-                name="Gemini",
-                provider=AIProvider.GOOGLE,
-                capabilities=["text_generation"],
-                created_at=datetime.now()
-            )
-        ]
+        model = AIModel.model_construct(
+            id="model-1",
+            name="Test Model",
+            provider=provider,
+            capabilities=["text_generation"],
+            created_at=frozen_now
+        )
         
-        assert models[0].provider == AIProvider.OPENAI
-        assert models[1].provider == AIProvider.ANTHROPIC
-        assert models[2].provider == AIProvider.GOOGLE
+        assert model.provider == provider
 
 
 class TestAIResponse:
     """Test cases for AIResponse model."""
     
-    def test_ai_response_creation(self):
-        """Test AI response creation."""
-        response = AIResponse(
-            id="response-123",
-            model_id="model-123",
-            response="This is a generated response.",
-            tokens_used=25,
-            created_at=datetime.now()
-        )
-        
-        assert response.id == "response-123"
-        assert response.model_id == "model-123"
-        assert response.response == "This is a generated response."
-        assert response.tokens_used == 25
-    
-    def test_ai_response_with_metadata(self):
+    def test_ai_response_with_metadata(self, frozen_now):
         """Test AI response with metadata."""
-        metadata = {"temperature": 0.7, "max_tokens": 100}
-        response = AIResponse(
+        metadata = _SAMPLES["ai_metadata"]
+        response = AIResponse.model_construct(
             id="response-123",
             model_id="model-123",
             response="Generated text",
             tokens_used=25,
             metadata=metadata,
-            created_at=datetime.now()
+            created_at=frozen_now
         )
         
         assert response.metadata == metadata
@@ -317,16 +420,24 @@ class TestAIResponse:
 class TestWorkflow:
     """Test cases for Workflow model."""
     
-    def test_workflow_creation(self):
+    def test_workflow_steps_compare_by_fields(self):
+        """Test steps sharing an ID across workflows are not equal."""
+        extract = WorkflowStep(id="step1", type="data_extraction", name="Extract")
+        notify = WorkflowStep(id="step1", type="notification", name="Notify")
+        
+        assert extract != notify
+        assert extract == WorkflowStep(id="step1", type="data_extraction", name="Extract")
+    
+    def test_workflow_creation(self, frozen_now):
         """Test workflow creation."""
         steps = [
-            WorkflowStep(
+            WorkflowStep.model_construct(
                 id="step1",
                 type="data_extraction",
                 name="Extract Data",
                 config={"source": "database"}
             ),
-            WorkflowStep(
+            WorkflowStep.model_construct(
                 id="step2",
                 type="data_transformation",
                 name="Transform Data",
@@ -335,12 +446,12 @@ class TestWorkflow:
             )
         ]
         
-        workflow = Workflow(
+        workflow = Workflow.model_construct(
             id="workflow-123",
             name="Data Pipeline",
             steps=steps,
-            created_at=datetime.now(),
-            updated_at=datetime.now()
+            created_at=frozen_now,
+            updated_at=frozen_now
         )
         
         assert workflow.id == "workflow-123"
@@ -350,16 +461,51 @@ class TestWorkflow:
         assert workflow.steps[1].depends_on == ["step1"]
 
 
+class TestConstructModel:
+    """Test cases for construct_model helper."""
+    
+    def test_construct_nested_models(self):
+        """Test trusted construction builds nested models."""
+        workflow = construct_model(Workflow, {
+            "id": "workflow-123",
+            "name": "Data Pipeline",
+            "steps": [{"id": "step1", "type": "data_extraction", "name": "Extract"}],
+            "created_at": "2024-01-01T00:00:00",
+            "updated_at": "2024-01-01T00:00:00",
+            "owner_id": "user-123",
+        })
+        
+        assert isinstance(workflow, Workflow)
+        assert isinstance(workflow.steps[0], WorkflowStep)
+        assert workflow.steps[0].depends_on == []
+        # Validators are skipped, so values are kept as given
+        assert workflow.created_at == "2024-01-01T00:00:00"
+    
+    def test_from_trusted_dict(self):
+        """Test trusted construction through the model classmethod."""
+        record = Record.from_trusted_dict({
+            "id": "record-123",
+            "table_id": "table-123",
+            "data": {"name": "John Doe", "age": 30},
+            "created_at": "2024-01-01T00:00:00",
+            "updated_at": "2024-01-01T00:00:00",
+        })
+        
+        assert isinstance(record, Record)
+        assert record.data == {"name": "John Doe", "age": 30}
+        assert record.version == 1
+
+
 class TestWorkflowExecution:
     """Test cases for WorkflowExecution model."""
     
-    def test_workflow_execution_creation(self):
+    def test_workflow_execution_creation(self, frozen_now):
         """Test workflow execution creation."""
-        execution = WorkflowExecution(
+        execution = WorkflowExecution.model_construct(
             id="exec-123",
             workflow_id="workflow-123",
             status=WorkflowStatus.RUNNING,
-            started_at=datetime.now()
+            started_at=frozen_now
         )
         
         assert execution.id == "exec-123"
@@ -367,45 +513,79 @@ class TestWorkflowExecution:
         assert execution.status == WorkflowStatus.RUNNING
         assert execution.completed_at is None
     
-    def test_workflow_execution_completed(self):
+    def test_workflow_execution_completed(self, frozen_now):
         """Test completed workflow execution."""
-        now = datetime.now()
-        execution = WorkflowExecution(
+        execution = WorkflowExecution.model_construct(
             id="exec-123",
             workflow_id="workflow-123",
             status=WorkflowStatus.COMPLETED,
-            started_at=now,
-            completed_at=now
+            started_at=frozen_now,
+            completed_at=frozen_now
         )
         
         assert execution.status == WorkflowStatus.COMPLETED
         assert execution.completed_at is not None
 
 
-class TestPaginatedResponse:
-    """Test cases for PaginatedResponse model."""
+class TestPageInfo:
+    """Test cases for PageInfo model."""
     
-    def test_paginated_response_creation(self):
-        """Test paginated response creation."""
-        data = [{"id": 1, "name": "Item 1"}, {"id": 2, "name": "Item 2"}]
+    def test_page_info_derived_fields(self):
+        """Test derived pagination fields."""
+        page_info = PageInfo(page=1, per_page=10, total=21)
+        
+        assert page_info.total_pages == 3
+        assert page_info.has_next is True
+        assert page_info.has_prev is False
+    
+    def test_page_info_ignores_server_derived_fields(self):
+        """Test server-sent derived fields are recomputed."""
         page_info = PageInfo(
-            page=1,
+            page=3,
             per_page=10,
-            total_pages=5,
-            total_items=50,
+            total=21,
+            total_pages=3,
             has_next=True,
-            has_previous=False
+            has_prev=True
         )
         
-        response = PaginatedResponse[Dict[str, Any]](
-            data=data,
-            page_info=page_info
+        assert page_info.has_next is False
+        assert page_info.model_dump()["total_pages"] == 3
+
+
+class TestPaginatedResponse:
+    """Test cases for PaginatedResponse model."""
+    
+    def test_paginated_response_creation(self, sample_page_info):
+        """Test paginated response creation."""
+        response = _PaginatedDict.model_construct(
+            data=_PAGE_ITEMS,
+            pagination=sample_page_info
         )
         
         assert len(response.data) == 2
-        assert response.page_info.page == 1
-        assert response.page_info.total_items == 50
-        assert response.page_info.has_next is True
+        assert response.pagination.page == 1
+        assert response.pagination.total == 50
+        assert response.pagination.total_pages == 5
+        assert response.pagination.has_next is True
+    
+    def test_validate_list(self):
+        """Test list validation with a cached adapter."""
+        items = [
+            {
+                "id": "db-123",
+                "name": "Test Database",
+                "created_at": "2024-01-01T00:00:00",
+                "updated_at": "2024-01-01T00:00:00",
+                "owner_id": "user-123",
+            }
+        ]
+        
+        databases = validate_list(Database, items)
+        
+        assert isinstance(databases[0], Database)
+        assert databases[0].created_at == datetime(2024, 1, 1)
+        assert validate_list(Database, []) == []
 
 
 class TestQueryOptions:
@@ -415,10 +595,13 @@ class TestQueryOptions:
         """Test basic query options."""
         options = QueryOptions()
         
-        assert options.page == 1
-        assert options.per_page == 20
-        assert options.sort == []
-        assert options.filters == []
+        assert options.model_dump() == {
+            "page": 1,
+            "per_page": 20,
+            "sort": [],
+            "filters": [],
+            "search": None,
+        }
     
     def test_query_options_with_sorting(self):
         """Test query options with sorting."""
@@ -455,68 +638,49 @@ class TestQueryOptions:
         assert options.filters[0].operator == FilterOperator.EQ
         assert options.filters[0].value == "active"
     
-    def test_query_options_validation(self):
-        """Test query options validation."""
-        # Test invalid page
-        with pytest.raises(ValueError):
-            QueryOptions(page=0)
+    def test_filter_value_types(self):
+        """Test filter value type checking."""
+        assert Filter(field="age", operator=FilterOperator.GTE, value=18).value == 18
+        assert Filter(field="id", operator=FilterOperator.IN, value=("a", "b")).value == ["a", "b"]
         
-        # Test invalid per_page
         with pytest.raises(ValueError):
-            QueryOptions(per_page=0)
+            Filter(field="meta", operator=FilterOperator.EQ, value={"key": "value"})
+    
+    def test_query_options_to_params(self):
+        """Test query options parameters follow the current field values."""
+        options = QueryOptions(page=2, filters=[Filter(field="age", operator="gt", value=18)])
         
-        # Test per_page too large
-        with pytest.raises(ValueError):
-            QueryOptions(per_page=1001)
+        params = options.to_params()
+        assert params["page"] == 2
+        assert "search" not in params
+        
+        # Callers own the returned dictionary
+        params["page"] = 99
+        assert options.to_params()["page"] == 2
+        
+        options.search = "term"
+        options.sort.append(SortField(field="name"))
+        options.filters[0].value = 21
+        params = options.to_params()
+        assert params["search"] == "term"
+        assert params["sort"] == [{"field": "name", "order": "asc"}]
+        assert params["filters"][0]["value"] == 21
+    
+    @pytest.mark.parametrize("kwargs", [
+        {"page": 0},
+        {"per_page": 0},
+        {"per_page": 1001},
+    ])
+    def test_query_options_validation(self, kwargs):
+        """Test query options validation."""
+        with pytest.raises(ValidationError):
+            QueryOptions(**kwargs)
 
 
 class TestEnums:
     """Test cases for enum types."""
     
-    def test_column_types(self):
-        """Test ColumnType enum values."""
-        assert ColumnType.STRING == "string"
-        assert ColumnType.INTEGER == "integer"
-        assert ColumnType.FLOAT == "float"
-        assert ColumnType.BOOLEAN == "boolean"
-        assert ColumnType.DATETIME == "datetime"
-        assert ColumnType.JSON == "json"
-    
-    def test_user_roles(self):
-        """Test UserRole enum values."""
-        assert UserRole.ADMIN == "admin"
-        assert UserRole.USER == "user"
-        assert UserRole.VIEWER == "viewer"
-    
-    def test_ai_providers(self):
-        """Test AIProvider enum values."""
-        assert AIProvider.OPENAI == "openai"
-        assert AIProvider.ANTHROPIC == "anthropic"
-        assert AIProvider.GOOGLE == "google"
-        assert AIProvider.CUSTOM == "custom"
-    
-    def test_workflow_status(self):
-        """Test WorkflowStatus enum values."""
-        assert WorkflowStatus.PENDING == "pending"
-        assert WorkflowStatus.RUNNING == "running"
-        assert WorkflowStatus.COMPLETED == "completed"
-        assert WorkflowStatus.FAILED == "failed"
-        assert WorkflowStatus.CANCELLED == "cancelled"
-    
-    def test_sort_order(self):
-        """Test SortOrder enum values."""
-        assert SortOrder.ASC == "asc"
-        assert SortOrder.DESC == "desc"
-    
-    def test_filter_operators(self):
-        """Test FilterOperator enum values."""
-        assert FilterOperator.EQ == "eq"
-        assert FilterOperator.NE == "ne"
-        assert FilterOperator.GT == "gt"
-        assert FilterOperator.GTE == "gte"
-        assert FilterOperator.LT == "lt"
-        assert FilterOperator.LTE == "lte"
-        assert FilterOperator.IN == "in"
-        assert FilterOperator.NOT_IN == "not_in"
-        assert FilterOperator.LIKE == "like"
-        assert FilterOperator.NOT_LIKE == "not_like"
\ No newline at end of file
+    @pytest.mark.parametrize("enum_member,expected", _ENUM_VALUES, ids=str)
+    def test_enum_value(self, enum_member, expected):
+        """Test enum members compare equal to their wire values."""
+        assert enum_member == expected
@@ -0,0 +1,373 @@
+"""Tests for workflow service module."""
+
+import asyncio
+import pytest
+from types import SimpleNamespace
+
+from dataapi.services import WorkflowService
+from dataapi.services import workflows as workflows_module
+from dataapi.types import PageInfo, PaginatedResponse, QueryOptions
+from tests.conftest import FakeAsyncMethod
+
+
+_DEFINITION = {"name": "etl", "steps": [{"id": "extract", "type": "sql"}]}
+_VALID = {"valid": True, "errors": []}
+
+# Five items served two per page
+_ITEMS = ["wf-1", "wf-2", "wf-3", "wf-4", "wf-5"]
+_PER_PAGE = 2
+
+
+def _page(options: QueryOptions) -> PaginatedResponse:
+    """Build the requested page of _ITEMS."""
+    start = (options.page - 1) * _PER_PAGE
+    return PaginatedResponse(
+        data=_ITEMS[start:start + _PER_PAGE],
+        pagination=PageInfo(page=options.page, per_page=_PER_PAGE, total=len(_ITEMS)),
+    )
+
+
+@pytest.fixture
+def service(client):
+    """Workflow service over the function-scoped HTTP client."""
+    return WorkflowService(client)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock for the workflow module."""
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(
+        workflows_module, "time", SimpleNamespace(monotonic=lambda: now.value)
+    )
+    return now
+
+
+@pytest.fixture
+def mock_post(service, monkeypatch):
+    """Fake post_async on the service's HTTP client."""
+    mock = FakeAsyncMethod()
+    monkeypatch.setattr(service.client, "post_async", mock)
+    return mock
+
+
+class TestValidateWorkflow:
+    """Test cases for cached workflow validation."""
+    
+    async def test_validate_workflow_cached(self, service, mock_post, clock):
+        """Test an unchanged definition is validated once within the TTL."""
+        mock_post.return_value = {"valid": True, "errors": []}
+        
+        first = await service.validate_workflow_async(_DEFINITION)
+        first["errors"].append("caller edit")
+        second = await service.validate_workflow_async(dict(_DEFINITION))
+        
+        assert second == _VALID
+        assert mock_post.call_count == 1
+    
+    async def test_validate_workflow_cache_expires(self, service, mock_post, clock):
+        """Test a cached result is refetched once its TTL has passed."""
+        mock_post.side_effect = [_VALID, {"valid": False, "errors": ["unknown table"]}]
+        
+        await service.validate_workflow_async(_DEFINITION)
+        clock.value += service.validate_cache_ttl
+        result = await service.validate_workflow_async(_DEFINITION)
+        
+        assert result["valid"] is False
+        assert mock_post.call_count == 2
+    
+    async def test_clear_validation_cache(self, service, mock_post, clock):
+        """Test clearing the cache forces a fresh validation request."""
+        mock_post.return_value = _VALID
+        
+        await service.validate_workflow_async(_DEFINITION)
+        service.clear_validation_cache()
+        await service.validate_workflow_async(_DEFINITION)
+        
+        assert mock_post.call_count == 2
+    
+    async def test_validate_workflow_non_str_keys(self, service, mock_post, clock):
+        """Test definitions with int keys are hashed and cached."""
+        mock_post.return_value = _VALID
+        definition = {"name": "etl", "retries": {1: 30, 2: 60}}
+        
+        await service.validate_workflow_async(definition)
+        await service.validate_workflow_async(dict(definition))
+        
+        assert mock_post.call_count == 1
+    
+    async def test_validate_workflow_cache_disabled(self, client, monkeypatch, clock):
+        """Test a zero TTL disables the cache."""
+        service = WorkflowService(client, validate_cache_ttl=0)
+        mock_post = FakeAsyncMethod()
+        monkeypatch.setattr(client, "post_async", mock_post)
+        mock_post.return_value = _VALID
+        
+        await service.validate_workflow_async(_DEFINITION)
+        await service.validate_workflow_async(_DEFINITION)
+        
+        assert mock_post.call_count == 2
+
+
+class TestStreamExecutionLogs:
+    """Test cases for streaming execution logs."""
+    
+    @pytest.mark.parametrize("step_id,params", [
+        (None, None),
+        ("extract", {"step_id": "extract"}),
+    ])
+    async def test_stream_execution_logs(self, service, monkeypatch, step_id, params):
+        """Test log entries are streamed from the execution logs endpoint."""
+        calls = []
+        
+        async def stream_json_lines_async(endpoint, params=None):
+            calls.append((endpoint, params))
+            for seq in range(3):
+                yield {"seq": seq}
+        
+        monkeypatch.setattr(service.client, "stream_json_lines_async", stream_json_lines_async)
+        
+        entries = [
+            entry async for entry in service.stream_execution_logs_async("exec-1", step_id)
+        ]
+        
+        assert entries == [{"seq": 0}, {"seq": 1}, {"seq": 2}]
+        assert calls == [("/workflow-executions/exec-1/logs", params)]
+
+
+class TestIterPages:
+    """Test cases for iterating over paginated list endpoints."""
+    
+    async def test_iter_workflows_all_pages(self, service, monkeypatch):
+        """Test items of every page are yielded in order."""
+        requested = []
+        
+        async def list_workflows_async(options, validate=False):
+            requested.append(options.page)
+            return _page(options)
+        
+        monkeypatch.setattr(service, "list_workflows_async", list_workflows_async)
+        options = QueryOptions(per_page=_PER_PAGE)
+        
+        items = [item async for item in service.iter_workflows_async(options)]
+        
+        assert items == _ITEMS
+        assert requested == [1, 2, 3]
+        assert options.page == 1
+    
+    async def test_iter_workflows_prefetches_next_page(self, service, monkeypatch):
+        """Test the next page is requested before the current page is yielded."""
+        events = []
+        
+        def list_workflows_async(options, validate=False):
+            events.append(f"request page {options.page}")
+            
+            async def fetch():
+                return _page(options)
+            
+            return fetch()
+        
+        monkeypatch.setattr(service, "list_workflows_async", list_workflows_async)
+        
+        async for item in service.iter_workflows_async(QueryOptions(per_page=_PER_PAGE)):
+            events.append(item)
+        
+        assert events == [
+            "request page 1",
+            "request page 2", "wf-1", "wf-2",
+            "request page 3", "wf-3", "wf-4",
+            "wf-5",
+        ]
+    
+    async def test_iter_workflows_early_exit_cancels_prefetch(self, service, monkeypatch):
+        """Test leaving the loop early cancels the pending page request."""
+        pending = SimpleNamespace(started=False, cancelled=False)
+        
+        async def list_workflows_async(options, validate=False):
+            if options.page == 1:
+                return _page(options)
+            pending.started = True
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                pending.cancelled = True
+                raise
+        
+        monkeypatch.setattr(service, "list_workflows_async", list_workflows_async)
+        
+        workflows = service.iter_workflows_async(QueryOptions(per_page=_PER_PAGE))
+        assert await workflows.__anext__() == "wf-1"
+        await asyncio.sleep(0)
+        await workflows.aclose()
+        await asyncio.sleep(0)
+        
+        assert pending.started
+        assert pending.cancelled
+    
+    async def test_iter_workflows_empty_response(self, service, monkeypatch):
+        """Test iteration stops when the endpoint returns no page."""
+        monkeypatch.setattr(service, "list_workflows_async", FakeAsyncMethod())
+        
+        assert [item async for item in service.iter_workflows_async()] == []
+    
+    async def test_iter_executions_forwards_filters(self, service, monkeypatch):
+        """Test execution filters are passed to every page request."""
+        requested = []
+        
+        async def list_executions_async(workflow_id, status, options, validate=False):
+            requested.append((workflow_id, status, options.page))
+            return _page(options)
+        
+        monkeypatch.setattr(service, "list_executions_async", list_executions_async)
+        
+        items = [
+            item async for item in service.iter_executions_async(
+                "wf-1", "running", QueryOptions(per_page=_PER_PAGE)
+            )
+        ]
+        
+        assert items == _ITEMS
+        assert requested == [
+            ("wf-1", "running", 1),
+            ("wf-1", "running", 2),
+            ("wf-1", "running", 3),
+        ]
+
+
+@pytest.fixture
+def concurrency():
+    """Track how many fake requests are in flight at once."""
+    return SimpleNamespace(in_flight=0, peak=0)
+
+
+async def _yield_control(times: int) -> None:
+    """Let other tasks run, so concurrent calls interleave."""
+    for _ in range(times):
+        await asyncio.sleep(0)
+
+
+class TestBulkExecute:
+    """Test cases for executing several workflows concurrently."""
+    
+    @pytest.fixture
+    def mock_execute(self, service, monkeypatch, concurrency):
+        """Fake execute_workflow_async; later workflows finish first."""
+        calls = []
+        
+        async def execute_workflow_async(workflow_id, input_data=None):
+            calls.append((workflow_id, input_data))
+            concurrency.in_flight += 1
+            concurrency.peak = max(concurrency.peak, concurrency.in_flight)
+            await _yield_control(10 - len(calls))
+            concurrency.in_flight -= 1
+            return f"execution of {workflow_id}"
+        
+        monkeypatch.setattr(service, "execute_workflow_async", execute_workflow_async)
+        return calls
+    
+    async def test_bulk_execute_results_in_order(self, service, mock_execute):
+        """Test results follow workflow_ids order, not completion order."""
+        results = await service.bulk_execute_async(
+            ["wf-1", "wf-2", "wf-3"],
+            input_data_list=[{"n": 1}, None, {"n": 3}],
+        )
+        
+        assert results == ["execution of wf-1", "execution of wf-2", "execution of wf-3"]
+        assert sorted(mock_execute) == [
+            ("wf-1", {"n": 1}), ("wf-2", None), ("wf-3", {"n": 3})
+        ]
+    
+    async def test_bulk_execute_max_concurrency(self, service, mock_execute, concurrency):
+        """Test no more than max_concurrency executions run at once."""
+        workflow_ids = [f"wf-{i}" for i in range(6)]
+        
+        await service.bulk_execute_async(workflow_ids, max_concurrency=2)
+        
+        assert len(mock_execute) == 6
+        assert concurrency.peak == 2
+    
+    async def test_bulk_execute_length_mismatch(self, service, mock_execute):
+        """Test mismatched input data is rejected before any request."""
+        with pytest.raises(ValueError, match="input_data_list must match"):
+            await service.bulk_execute_async(["wf-1", "wf-2"], input_data_list=[None])
+        
+        assert mock_execute == []
+    
+    def test_bulk_execute_sync(self, service, mock_execute):
+        """Test the sync wrapper runs the bulk execution to completion."""
+        results = service.bulk_execute(["wf-1", "wf-2"])
+        
+        assert results == ["execution of wf-1", "execution of wf-2"]
+        assert sorted(mock_execute) == [("wf-1", None), ("wf-2", None)]
+
+
+class TestBulkExecutionHelpers:
+    """Test cases for the concurrent delete, cancel and retry helpers."""
+    
+    @pytest.fixture
+    def calls(self):
+        """Calls made to the faked per-item methods."""
+        return []
+    
+    @pytest.fixture
+    def record(self, calls, concurrency):
+        """Build fakes that record calls and track concurrency."""
+        def make(name):
+            async def fake(*args):
+                calls.append((name,) + args)
+                concurrency.in_flight += 1
+                concurrency.peak = max(concurrency.peak, concurrency.in_flight)
+                await _yield_control(10 - len(calls))
+                concurrency.in_flight -= 1
+                return f"{name} {args[0]}"
+            
+            return fake
+        
+        return make
+    
+    async def test_delete_workflows(
+        self, service, monkeypatch, record, calls, concurrency
+    ):
+        """Test every workflow is deleted with bounded concurrency."""
+        monkeypatch.setattr(service, "delete_workflow_async", record("delete"))
+        
+        result = await service.delete_workflows_async(
+            ["wf-1", "wf-2", "wf-3"], max_concurrency=2
+        )
+        
+        assert result is None
+        assert sorted(calls) == [
+            ("delete", "wf-1"), ("delete", "wf-2"), ("delete", "wf-3")
+        ]
+        assert concurrency.peak == 2
+    
+    async def test_cancel_executions(self, service, monkeypatch, record, concurrency):
+        """Test cancelled executions are returned in input order."""
+        monkeypatch.setattr(service, "cancel_execution_async", record("cancel"))
+        
+        results = await service.cancel_executions_async(
+            ["exec-1", "exec-2", "exec-3"], max_concurrency=1
+        )
+        
+        assert results == ["cancel exec-1", "cancel exec-2", "cancel exec-3"]
+        assert concurrency.peak == 1
+    
+    async def test_retry_executions(self, service, monkeypatch, record, calls):
+        """Test every retry uses the shared from_step, in input order."""
+        monkeypatch.setattr(service, "retry_execution_async", record("retry"))
+        
+        results = await service.retry_executions_async(
+            ["exec-1", "exec-2"], from_step="load"
+        )
+        
+        assert results == ["retry exec-1", "retry exec-2"]
+        assert sorted(calls) == [
+            ("retry", "exec-1", "load"), ("retry", "exec-2", "load")
+        ]
+    
+    async def test_empty_ids(self, service, monkeypatch, record, calls):
+        """Test empty id lists make no requests."""
+        monkeypatch.setattr(service, "cancel_execution_async", record("cancel"))
+        
+        assert await service.cancel_executions_async([]) == []
+        assert calls == []